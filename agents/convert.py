@@ -0,0 +1,63 @@
+"""
+shamir-convert: CLI agent for converting between text and binary share files
+"""
+
+import argparse
+from pathlib import Path
+
+from shamir.format.v2 import binary_to_text, text_to_binary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert FORMAT=2 share files between text and binary encodings"
+    )
+    parser.add_argument(
+        "--to",
+        choices=["binary", "text"],
+        required=True,
+        help="Target encoding"
+    )
+    parser.add_argument(
+        "--input-dir",
+        required=True,
+        help="Directory with share files in the source encoding"
+    )
+    parser.add_argument(
+        "--output-dir",
+        required=True,
+        help="Directory to write the converted share files to"
+    )
+    args = parser.parse_args()
+
+    input_dir = Path(args.input_dir)
+    output_dir = Path(args.output_dir)
+
+    if not input_dir.is_dir():
+        raise ValueError("input directory does not exist")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    converted = 0
+    for path in sorted(input_dir.iterdir()):
+        if not path.is_file():
+            continue
+
+        if args.to == "binary":
+            target = output_dir / (path.stem + ".bin")
+            data = text_to_binary(path.read_text(encoding="utf-8"))
+            with target.open("xb") as handle:
+                handle.write(data)
+        else:
+            target = output_dir / (path.stem + ".txt")
+            text = binary_to_text(path.read_bytes())
+            with target.open("x", encoding="utf-8") as handle:
+                handle.write(text)
+
+        converted += 1
+
+    print(f"[✓] {converted} share files converted to {args.to}")
+
+
+if __name__ == "__main__":
+    main()
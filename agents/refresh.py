@@ -0,0 +1,136 @@
+"""
+shamir-refresh: CLI agent for proactive re-randomization of share files
+"""
+
+import argparse
+import os
+from contextlib import ExitStack
+from pathlib import Path
+
+from shamir.format.v2 import ShareReader, ShareWriter
+from shamir.sss_gf256 import DEFAULT_CHUNK_SIZE, refresh_stream
+from utils.repo import BACKUP_SUFFIX, STAGED_SUFFIX, load_share_headers
+
+
+def share_dirs(root: Path):
+    """
+    Yield every directory under root that directly contains files.
+
+    Each such directory holds the complete share set of one secret.
+    """
+    for directory in sorted([root, *root.rglob("*")]):
+        if directory.is_dir() and any(p.is_file() for p in directory.iterdir()):
+            yield directory
+
+
+def restore_interrupted(share_dir: Path) -> None:
+    """
+    Return share_dir to one consistent share set after an interruption.
+
+    A refresh stages every new share as *.refresh, hard-links every
+    original to *.orig and only then moves the staged files into place.
+    While any staged file is left, the swap did not finish and the
+    originals are restored; otherwise the swap completed and only the
+    backups are removed.
+    """
+    staged = sorted(share_dir.glob("*" + STAGED_SUFFIX))
+    backups = sorted(share_dir.glob("*" + BACKUP_SUFFIX))
+
+    if staged:
+        for backup in backups:
+            os.replace(backup, backup.with_suffix(""))
+            backup.unlink(missing_ok=True)
+        for path in staged:
+            path.unlink()
+    else:
+        for backup in backups:
+            backup.unlink()
+
+
+def refresh_dir(share_dir: Path, chunk_size: int) -> int:
+    """
+    Refresh all share files in share_dir and return the share count.
+
+    Refreshed shares are written next to the originals and moved into
+    place only after every file of the set has been written. Any
+    failure, here or in an earlier interrupted run, leaves either the
+    old or the new share set, never a mix of both.
+    """
+    restore_interrupted(share_dir)
+
+    threshold, total, shares = load_share_headers(share_dir)
+
+    if sorted(shares) != list(range(1, total + 1)):
+        raise ValueError(f"{share_dir}: all {total} shares are required")
+
+    staged = {
+        index: path.with_name(path.name + STAGED_SUFFIX)
+        for index, path in shares.items()
+    }
+    backups = {
+        index: path.with_name(path.name + BACKUP_SUFFIX)
+        for index, path in shares.items()
+    }
+
+    try:
+        with ExitStack() as stack:
+            readers = []
+            writers = []
+
+            for index, path in sorted(shares.items()):
+                handle = stack.enter_context(path.open("r", encoding="utf-8"))
+                readers.append((index, ShareReader(handle)))
+
+                out = stack.enter_context(staged[index].open("x", encoding="utf-8"))
+                writers.append(
+                    ShareWriter(out, index=index, threshold=threshold, total=total)
+                )
+
+            refresh_stream(readers, writers, threshold, chunk_size)
+
+            for writer in writers:
+                writer.close()
+
+        for index, path in shares.items():
+            os.link(path, backups[index])
+
+        for index, path in shares.items():
+            os.replace(staged[index], path)
+    finally:
+        restore_interrupted(share_dir)
+
+    return len(shares)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-randomize FORMAT=2 share files without recovering secrets"
+    )
+    parser.add_argument(
+        "--root",
+        required=True,
+        help="Directory tree with one complete share set per directory"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Bytes of share data processed per streaming step"
+    )
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    if not root.is_dir():
+        raise ValueError("root directory does not exist")
+
+    refreshed = 0
+    for share_dir in share_dirs(root):
+        count = refresh_dir(share_dir, args.chunk_size)
+        print(f"[✓] {share_dir}: {count} shares refreshed")
+        refreshed += 1
+
+    print(f"[✓] {refreshed} share sets refreshed")
+
+
+if __name__ == "__main__":
+    main()
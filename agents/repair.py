@@ -0,0 +1,90 @@
+"""
+shamir-repair: CLI agent for regenerating lost Shamir share files
+"""
+
+import argparse
+from contextlib import ExitStack
+from pathlib import Path
+
+from shamir.format.v2 import ShareReader, ShareWriter
+from shamir.sss_gf256 import DEFAULT_CHUNK_SIZE, repair_stream
+from utils.repo import load_share_headers
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Regenerate lost share indices without recovering the secret"
+    )
+    parser.add_argument(
+        "--input-dir",
+        required=True,
+        help="Directory with at least threshold FORMAT=2 share files"
+    )
+    parser.add_argument(
+        "--output-dir",
+        required=True,
+        help="Directory to write the regenerated share files to"
+    )
+    parser.add_argument(
+        "--index",
+        type=int,
+        nargs="+",
+        required=True,
+        help="Share indices to regenerate"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Bytes of share data processed per streaming step"
+    )
+    args = parser.parse_args()
+
+    threshold, total, shares = load_share_headers(Path(args.input_dir))
+
+    if len(shares) < threshold:
+        raise ValueError("insufficient number of shares")
+
+    for index in args.index:
+        if not 1 <= index <= total:
+            raise ValueError(f"share index {index} is not in 1..{total}")
+        if index in shares:
+            raise ValueError(f"share {index} is not missing")
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    with ExitStack() as stack:
+        readers = []
+        for index in sorted(shares)[:threshold]:
+            handle = stack.enter_context(shares[index].open("r", encoding="utf-8"))
+            readers.append((index, ShareReader(handle)))
+
+        writers = []
+        for index in args.index:
+            share_path = output_dir / f"share-{index}.txt"
+            handle = stack.enter_context(share_path.open("x", encoding="utf-8"))
+            writers.append(
+                (
+                    index,
+                    ShareWriter(handle, index=index, threshold=threshold, total=total),
+                )
+            )
+
+        repair_stream(
+            readers,
+            writers,
+            args.chunk_size,
+            threshold=threshold,
+            total=total,
+        )
+
+        for _, writer in writers:
+            writer.close()
+
+    for index in args.index:
+        print(f"[✓] Share {index} regenerated")
+
+
+if __name__ == "__main__":
+    main()
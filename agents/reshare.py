@@ -0,0 +1,160 @@
+"""
+shamir-reshare: CLI agent for moving share files to a new threshold policy
+"""
+
+import argparse
+import shutil
+from contextlib import ExitStack
+from pathlib import Path
+
+from shamir.format.v2 import ShareReader, ShareWriter
+from shamir.sss_gf256 import DEFAULT_CHUNK_SIZE, recover_stream, subshare_stream
+from utils.repo import load_share_headers
+
+
+def send_subshares(
+    share_path: Path,
+    out_dir: Path,
+    threshold: int,
+    total: int,
+    chunk_size: int,
+):
+    """
+    Current custodian step: sub-split one share file into out_dir.
+    """
+    out_dir.mkdir(parents=True)
+
+    with ExitStack() as stack:
+        reader = ShareReader(
+            stack.enter_context(share_path.open("r", encoding="utf-8"))
+        )
+
+        writers = []
+        for index in range(1, total + 1):
+            handle = stack.enter_context(
+                (out_dir / f"share-{index}.txt").open("x", encoding="utf-8")
+            )
+            writers.append(
+                ShareWriter(handle, index=index, threshold=threshold, total=total)
+            )
+
+        subshare_stream(reader, writers, threshold, total, chunk_size)
+
+        for writer in writers:
+            writer.close()
+
+
+def combine_subshares(
+    sources,
+    share_path: Path,
+    index: int,
+    threshold: int,
+    total: int,
+    chunk_size: int,
+):
+    """
+    New custodian step: combine received sub-shares into one share file.
+
+    sources holds (old_index, sub_share_path) pairs.
+    """
+    with ExitStack() as stack:
+        readers = []
+        for old_index, path in sources:
+            handle = stack.enter_context(path.open("r", encoding="utf-8"))
+            readers.append((old_index, ShareReader(handle)))
+
+        handle = stack.enter_context(share_path.open("x", encoding="utf-8"))
+        writer = ShareWriter(handle, index=index, threshold=threshold, total=total)
+
+        recover_stream(readers, writer, chunk_size)
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-share FORMAT=2 share files under a new threshold policy"
+    )
+    parser.add_argument(
+        "--input-dir",
+        required=True,
+        help="Directory with at least threshold current share files"
+    )
+    parser.add_argument(
+        "--transfer-dir",
+        required=True,
+        help="Directory standing in for custodian-to-custodian transfer"
+    )
+    parser.add_argument(
+        "--output-dir",
+        required=True,
+        help="Directory to write the new share files to"
+    )
+    parser.add_argument("--threshold", type=int, required=True)
+    parser.add_argument("--total", type=int, required=True)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Bytes of share data processed per streaming step"
+    )
+    args = parser.parse_args()
+
+    if args.threshold < 2:
+        raise ValueError("threshold must be >= 2")
+    if args.total < args.threshold:
+        raise ValueError("total must be >= threshold")
+
+    threshold, _, shares = load_share_headers(Path(args.input_dir))
+
+    if len(shares) < threshold:
+        raise ValueError("insufficient number of shares")
+
+    transfer_dir = Path(args.transfer_dir)
+    output_dir = Path(args.output_dir)
+
+    if transfer_dir.exists():
+        raise ValueError("transfer directory already exists")
+    if output_dir.exists():
+        raise ValueError("output directory already exists")
+
+    selected = sorted(shares)[:threshold]
+
+    try:
+        for old_index in selected:
+            send_subshares(
+                shares[old_index],
+                transfer_dir / f"from-{old_index}",
+                args.threshold,
+                args.total,
+                args.chunk_size,
+            )
+            print(f"[✓] Custodian {old_index} sent sub-shares")
+
+        output_dir.mkdir(parents=True)
+
+        for index in range(1, args.total + 1):
+            combine_subshares(
+                [
+                    (
+                        old_index,
+                        transfer_dir / f"from-{old_index}" / f"share-{index}.txt",
+                    )
+                    for old_index in selected
+                ],
+                output_dir / f"share-{index}.txt",
+                index,
+                args.threshold,
+                args.total,
+                args.chunk_size,
+            )
+            print(f"[✓] Custodian {index} combined new share")
+    finally:
+        # Sub-shares from threshold custodians determine the secret.
+        shutil.rmtree(transfer_dir, ignore_errors=True)
+
+    print(f"[✓] Re-shared {threshold}-of-{len(shares)} to "
+          f"{args.threshold}-of-{args.total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Per-share parse cost for FORMAT=2 text shares.
+
+Serializes shares with a small payload (header-dominated) and with a
+large payload (DATA-dominated), then times the field-by-field parser,
+the single-pass parse_share() and parse_many() over the same shares
+written to disk. DATA is decoded lazily, so parse_share() alone is the
+cost of a share that is parsed but never used; "parse_share + data"
+and "b64decode alone" show what decoding adds.
+
+Usage:
+    python benchmarks/parse_shares.py [N]
+"""
+
+import base64
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from shamir.format.v2 import _parse_fields, parse_many, parse_share, serialize_share
+
+
+LARGE_PAYLOAD = 4 << 20
+LARGE_COUNT = 8
+
+
+def _report(label: str, seconds: float, count: int) -> None:
+    print(f"{label:<24} {seconds * 1e6 / count:10.2f} us/share")
+
+
+def _run(texts) -> None:
+    count = len(texts)
+
+    start = time.perf_counter()
+    for text in texts:
+        _parse_fields(text)
+    _report("field-by-field", time.perf_counter() - start, count)
+
+    start = time.perf_counter()
+    for text in texts:
+        parse_share(text)
+    _report("parse_share", time.perf_counter() - start, count)
+
+    start = time.perf_counter()
+    for text in texts:
+        parse_share(text).data
+    _report("parse_share + data", time.perf_counter() - start, count)
+
+    start = time.perf_counter()
+    for text in texts:
+        base64.b64decode(text[text.index("DATA=") + 5:], validate=False)
+    _report("b64decode alone", time.perf_counter() - start, count)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i, text in enumerate(texts):
+            path = Path(tmp) / f"share-{i}.txt"
+            path.write_text(text, encoding="ascii")
+            paths.append(path)
+
+        start = time.perf_counter()
+        for path in paths:
+            parse_share(path.read_text(encoding="utf-8"))
+        _report("read_text + parse_share", time.perf_counter() - start, count)
+
+        start = time.perf_counter()
+        parse_many(paths)
+        _report("parse_many", time.perf_counter() - start, count)
+
+
+def _shares(count: int, size: int):
+    return [
+        serialize_share(
+            index=i % 255 + 1,
+            threshold=3,
+            total=255,
+            data=os.urandom(size),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"{count} shares, 32-byte payload")
+    _run(_shares(count, 32))
+
+    print(f"{LARGE_COUNT} shares, {LARGE_PAYLOAD >> 20} MiB payload")
+    _run(_shares(LARGE_COUNT, LARGE_PAYLOAD))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ The design goal is explicitness and auditability, not abstraction.
 """
 
 import os
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
@@ -46,6 +46,27 @@ def _derive_key(secret: bytes, salt: bytes) -> bytes:
 # Public API
 # ---------------------------------------------------------------------------
 
+def _seal(
+    secret: bytes,
+    salt: bytes,
+    nonce: bytes,
+    associated_data: Optional[bytes],
+) -> bytes:
+    """
+    Encrypt one secret under a key derived from it and salt.
+    """
+    key = _derive_key(secret, salt)
+    aead = ChaCha20Poly1305(key)
+
+    ciphertext = aead.encrypt(
+        nonce,
+        secret,
+        associated_data,
+    )
+
+    return salt + nonce + ciphertext
+
+
 def encrypt_secret(secret: bytes, associated_data: Optional[bytes] = None) -> bytes:
     """
     Encrypt and authenticate a secret using AEAD.
@@ -59,16 +80,34 @@ def encrypt_secret(secret: bytes, associated_data: Optional[bytes] = None) -> by
     salt = os.urandom(SALT_LEN)
     nonce = os.urandom(NONCE_LEN)
 
-    key = _derive_key(secret, salt)
-    aead = ChaCha20Poly1305(key)
+    return _seal(secret, salt, nonce, associated_data)
 
-    ciphertext = aead.encrypt(
-        nonce,
-        secret,
-        associated_data,
-    )
 
-    return salt + nonce + ciphertext
+def encrypt_many(
+    secrets: Sequence[bytes],
+    associated_data: Optional[bytes] = None,
+) -> List[bytes]:
+    """
+    Encrypt and authenticate a batch of secrets, one payload each.
+
+    Every secret still gets its own salt, nonce and derived key, but
+    salts and nonces for the whole batch are drawn in a single
+    os.urandom call. Each payload has the encrypt_secret() format.
+    """
+    if any(not secret for secret in secrets):
+        raise ValueError("Secret must not be empty")
+
+    width = SALT_LEN + NONCE_LEN
+    pool = os.urandom(width * len(secrets))
+
+    payloads = []
+    for i, secret in enumerate(secrets):
+        offset = i * width
+        salt = pool[offset:offset + SALT_LEN]
+        nonce = pool[offset + SALT_LEN:offset + width]
+        payloads.append(_seal(secret, salt, nonce, associated_data))
+
+    return payloads
 
 
 def decrypt_secret(payload: bytes, associated_data: Optional[bytes] = None) -> bytes:
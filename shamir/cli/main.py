@@ -9,6 +9,11 @@ processing beyond delegating execution to command handlers.
 import argparse
 import sys
 
+from shamir.cli.recover import run_recover
+from shamir.cli.split import run_split
+from shamir.cli.validate import run_validate
+from shamir.core.shamir import SELECTION_POLICIES
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -38,8 +43,20 @@ def build_parser() -> argparse.ArgumentParser:
     split_parser.add_argument("--input", required=True)
     split_parser.add_argument("--output-dir", required=True)
     split_parser.add_argument("--aad", required=False)
+    split_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        required=False,
+        help="Bytes of payload processed per streaming step and worker",
+    )
+    split_parser.add_argument(
+        "--jobs",
+        type=int,
+        required=False,
+        help="Number of worker processes",
+    )
 
-    split_parser.set_defaults(func=None)
+    split_parser.set_defaults(func=run_split)
 
     # recover command
     recover_parser = subparsers.add_parser(
@@ -50,8 +67,49 @@ def build_parser() -> argparse.ArgumentParser:
     recover_parser.add_argument("--input-dir", required=True)
     recover_parser.add_argument("--output", required=True)
     recover_parser.add_argument("--aad", required=False)
+    recover_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        required=False,
+        help="Bytes of share data decoded per streaming step and worker",
+    )
+    recover_parser.add_argument(
+        "--jobs",
+        type=int,
+        required=False,
+        help="Number of worker processes",
+    )
+    recover_parser.add_argument(
+        "--select",
+        choices=SELECTION_POLICIES,
+        required=False,
+        help="How threshold shares are chosen for reconstruction "
+        "(default: lowest, or explicit when --indices is given)",
+    )
+    recover_parser.add_argument(
+        "--indices",
+        type=int,
+        nargs="+",
+        required=False,
+        help="Share indices to use; implies --select explicit",
+    )
+    recover_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Check unused shares against the selected ones",
+    )
+
+    recover_parser.set_defaults(func=run_recover)
+
+    # validate command
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="Validate share files without recovering the secret",
+    )
+
+    validate_parser.add_argument("--input-dir", required=True)
 
-    recover_parser.set_defaults(func=None)
+    validate_parser.set_defaults(func=run_validate)
 
     return parser
 
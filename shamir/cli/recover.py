@@ -2,25 +2,43 @@
 Recover command implementation for shamir-cli.
 
 This module orchestrates the recovery workflow:
-- read and parse share files
+- read and parse share file headers
 - validate consistency and threshold satisfaction
 - reconstruct the encrypted payload using Shamir Secret Sharing
 - decrypt and authenticate the payload using AEAD
 - write the recovered secret to disk
 
+Exactly threshold shares are selected by --select: "lowest" indices
+(the default), the "first" files in directory order, or an "explicit"
+list given with --indices, which implies "explicit". Only the selected
+shares are opened for reading DATA, and they are decoded and
+interpolated in lockstep, chunk by chunk. With --check the unused
+shares are compared against the selected ones before recovery.
+
 No cryptographic primitives are implemented here.
 """
 
+import io
+from contextlib import ExitStack
 from pathlib import Path
 
 from shamir.aead import decrypt_secret
-from shamir.sss_gf256 import recover_secret
-from shamir.format.v2 import parse_share
+from shamir.core.correction import check_consistency
+from shamir.core.shamir import select_shares
+from shamir.sss_gf256 import DEFAULT_CHUNK_SIZE, recover_stream
+from shamir.format.v2 import ShareReader, parse_many
 
 
 def run_recover(args) -> int:
     input_dir = Path(args.input_dir)
     output_path = Path(args.output)
+    chunk_size = getattr(args, "chunk_size", None)
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    jobs = getattr(args, "jobs", None)
+    if jobs is None:
+        jobs = 1
 
     if not input_dir.is_dir():
         raise ValueError("input directory does not exist")
@@ -28,6 +46,12 @@ def run_recover(args) -> int:
     if output_path.exists():
         raise ValueError("output file already exists")
 
+    if chunk_size < 1:
+        raise ValueError("chunk size must be >= 1")
+
+    if jobs < 1:
+        raise ValueError("jobs must be >= 1")
+
     aad = None
     if args.aad:
         aad_path = Path(args.aad)
@@ -43,8 +67,8 @@ def run_recover(args) -> int:
         if not path.is_file():
             continue
 
-        text = path.read_text(encoding="utf-8")
-        share = parse_share(text)
+        with path.open("r", encoding="utf-8") as handle:
+            share = ShareReader(handle)
 
         if threshold is None:
             threshold = share.threshold
@@ -56,7 +80,7 @@ def run_recover(args) -> int:
         if share.index in shares:
             raise ValueError("duplicate share index")
 
-        shares[share.index] = share.data
+        shares[share.index] = path
 
     if threshold is None:
         raise ValueError("no valid share files found")
@@ -64,8 +88,45 @@ def run_recover(args) -> int:
     if len(shares) < threshold:
         raise ValueError("insufficient number of shares")
 
-    payload = recover_secret(shares, threshold)
-    secret = decrypt_secret(payload, aad)
+    policy = getattr(args, "select", None)
+    indices = getattr(args, "indices", None)
+
+    if indices is not None:
+        if policy is None:
+            policy = "explicit"
+        elif policy != "explicit":
+            raise ValueError("--indices requires --select explicit")
+    elif policy is None:
+        policy = "lowest"
+
+    selected, unused = select_shares(
+        list(shares.items()), threshold, policy, indices
+    )
+
+    if getattr(args, "check", False) and unused:
+        parsed = parse_many([path for _, path in selected + unused])
+        inconsistent = check_consistency(
+            [(share.index, share.data) for share in parsed],
+            threshold,
+        )
+        if inconsistent:
+            raise ValueError(
+                "inconsistent shares: "
+                + ", ".join(str(index) for index in inconsistent)
+            )
+
+    payload = io.BytesIO()
+
+    with ExitStack() as stack:
+        readers = []
+
+        for index, path in selected:
+            handle = stack.enter_context(path.open("r", encoding="utf-8"))
+            readers.append((index, ShareReader(handle)))
+
+        recover_stream(readers, payload, chunk_size, workers=jobs)
+
+    secret = decrypt_secret(payload.getvalue(), aad)
 
     output_path.write_bytes(secret)
 
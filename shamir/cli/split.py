@@ -8,19 +8,32 @@ This module orchestrates the split workflow:
 - split the encrypted payload using Shamir Secret Sharing
 - serialize and write share files
 
+The encrypted payload is split and written in fixed-size chunks, so
+share data is streamed to every share file instead of being held in
+memory for all shares at once.
+
 No cryptographic primitives are implemented here.
 """
 
+import io
+from contextlib import ExitStack
 from pathlib import Path
 
 from shamir.aead import encrypt_secret
-from shamir.sss_gf256 import split_secret
-from shamir.format.v2 import serialize_share
+from shamir.sss_gf256 import DEFAULT_CHUNK_SIZE, split_stream
+from shamir.format.v2 import ShareWriter
 
 
 def run_split(args) -> int:
     threshold = args.threshold
     total = args.total
+    chunk_size = getattr(args, "chunk_size", None)
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    jobs = getattr(args, "jobs", None)
+    if jobs is None:
+        jobs = 1
 
     if threshold < 2:
         raise ValueError("threshold must be >= 2")
@@ -28,6 +41,12 @@ def run_split(args) -> int:
     if total < threshold:
         raise ValueError("total must be >= threshold")
 
+    if chunk_size < 1:
+        raise ValueError("chunk size must be >= 1")
+
+    if jobs < 1:
+        raise ValueError("jobs must be >= 1")
+
     input_path = Path(args.input)
     output_dir = Path(args.output_dir)
 
@@ -49,18 +68,35 @@ def run_split(args) -> int:
         aad = aad_path.read_bytes()
 
     payload = encrypt_secret(secret, aad)
-
-    shares = split_secret(payload, threshold, total)
-
-    for index, share_data in shares.items():
-        share_text = serialize_share(
-            index=index,
-            threshold=threshold,
-            total=total,
-            data=share_data,
+    del secret
+
+    with ExitStack() as stack:
+        writers = []
+
+        for index in range(1, total + 1):
+            share_path = output_dir / f"share-{index}.txt"
+            handle = stack.enter_context(
+                share_path.open("w", encoding="utf-8")
+            )
+            writers.append(
+                ShareWriter(
+                    handle,
+                    index=index,
+                    threshold=threshold,
+                    total=total,
+                )
+            )
+
+        split_stream(
+            io.BytesIO(payload),
+            writers,
+            threshold,
+            total,
+            chunk_size,
+            workers=jobs,
         )
 
-        share_path = output_dir / f"share-{index}.txt"
-        share_path.write_text(share_text, encoding="utf-8")
+        for writer in writers:
+            writer.close()
 
     return 0
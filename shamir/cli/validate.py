@@ -0,0 +1,62 @@
+"""
+Validate command implementation for shamir-cli.
+
+This module checks a directory of share files without recovering
+the secret:
+- parse every share file strictly
+- validate parameter consistency and index uniqueness
+- check that surplus shares lie on the same polynomial
+
+Surplus shares are compared against the interpolation of the lowest
+threshold indices over whole share rows; no payload is decrypted.
+
+No cryptographic primitives are implemented here.
+"""
+
+from pathlib import Path
+
+from shamir.core.correction import check_consistency
+from shamir.format.v2 import parse_many
+
+
+def run_validate(args) -> int:
+    input_dir = Path(args.input_dir)
+
+    if not input_dir.is_dir():
+        raise ValueError("input directory does not exist")
+
+    paths = [path for path in sorted(input_dir.iterdir()) if path.is_file()]
+
+    shares = {}
+    threshold = None
+    total = None
+
+    for share in parse_many(paths):
+        if threshold is None:
+            threshold = share.threshold
+            total = share.total
+        else:
+            if share.threshold != threshold or share.total != total:
+                raise ValueError("inconsistent share parameters")
+
+        if share.index in shares:
+            raise ValueError("duplicate share index")
+
+        shares[share.index] = share.data
+
+    if threshold is None:
+        raise ValueError("no valid share files found")
+
+    if len(shares) < threshold:
+        raise ValueError("insufficient number of shares")
+
+    inconsistent = check_consistency(sorted(shares.items()), threshold)
+    if inconsistent:
+        raise ValueError(
+            "inconsistent shares: "
+            + ", ".join(str(index) for index in inconsistent)
+        )
+
+    print(f"ok: {len(shares)} shares consistent")
+
+    return 0
@@ -4,12 +4,24 @@ Core cryptographic primitives for Shamir Secret Sharing.
 This module contains pure, deterministic implementations of:
 - GF(256) arithmetic
 - Polynomial operations
+- Whole-row GF(256) kernels
 - Shamir split and recover logic
+- Information dispersal (Rabin IDA)
+- Error-correcting recovery (Berlekamp-Welch)
+- Threshold re-sharing
+- Incremental quorum collection
+- Packed (ramp) secret sharing
 
 No I/O, no serialization, no CLI concerns.
 """
 
 from .gf256 import *
 from .polynomial import *
+from .kernels import *
 from .shamir import *
+from .ida import *
+from .correction import *
+from .resharing import *
+from .collector import *
+from .packed import *
 from .exceptions import *
@@ -0,0 +1,136 @@
+"""
+Incremental share collection for Shamir recovery.
+
+QuorumCollector accepts shares one at a time and keeps the
+interpolating polynomial in Newton form over whole rows. Adding the
+m-th share evaluates the current Newton form at the new index and
+derives one new coefficient row, O(m * len). The value at x = 0 is
+accumulated alongside, so once threshold shares have arrived the
+secret is already available and secret() only copies it out.
+
+Shares added beyond the threshold must have a zero Newton
+coefficient; a non-zero one means the shares are inconsistent.
+"""
+
+from typing import List, Tuple
+
+from . import kernels
+from .gf256 import add, inv, mul
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(
+        len(a), "little"
+    )
+
+
+class QuorumCollector:
+    """
+    Accumulate shares and reconstruct the secret incrementally.
+
+    The secret is taken from the first threshold shares in arrival
+    order; later shares are only checked for consistency. Removing the
+    most recently added share is O(1); removing an earlier one re-adds
+    the shares that arrived after it.
+    """
+
+    def __init__(self, threshold: int) -> None:
+        if threshold < 2:
+            raise ValueError("threshold must be at least 2")
+
+        self.threshold = threshold
+        self._length = None
+        self._shares: List[Tuple[int, bytes]] = []
+        self._coefficients: List[bytes] = []
+        self._terms: List[int] = []
+        self._value = 0
+
+    def __len__(self) -> int:
+        return len(self._shares)
+
+    @property
+    def indices(self) -> List[int]:
+        """Share indices in arrival order."""
+        return [index for index, _ in self._shares]
+
+    @property
+    def complete(self) -> bool:
+        """True once threshold shares have been added."""
+        return len(self._shares) >= self.threshold
+
+    @property
+    def consistent(self) -> bool:
+        """True if every share beyond the threshold agrees with the rest."""
+        return not any(
+            any(row) for row in self._coefficients[self.threshold:]
+        )
+
+    def add(self, index: int, data: bytes) -> None:
+        """
+        Add one share and extend the Newton form by one row.
+        """
+        if not 1 <= index <= 255:
+            raise ValueError("share index must be in 1..255")
+        if index in self.indices:
+            raise ValueError("duplicate share index")
+        if self._length is None:
+            self._length = len(data)
+        elif len(data) != self._length:
+            raise ValueError("inconsistent share lengths")
+
+        data = bytes(data)
+        xs = self.indices
+
+        # Evaluate the current Newton form at index, innermost first.
+        value = bytes(self._length)
+        for x, row in zip(reversed(xs), reversed(self._coefficients)):
+            value = _xor(kernels.scale(value, add(index, x)), row)
+
+        denominator = 1
+        at_zero = 1
+        for x in xs:
+            denominator = mul(denominator, add(index, x))
+            at_zero = mul(at_zero, x)
+
+        coefficient = kernels.scale(_xor(data, value), inv(denominator))
+
+        if len(self._shares) < self.threshold:
+            term = kernels.scale(coefficient, at_zero)
+            self._terms.append(int.from_bytes(term, "little"))
+            self._value ^= self._terms[-1]
+
+        self._shares.append((index, data))
+        self._coefficients.append(coefficient)
+
+    def remove(self, index: int) -> None:
+        """
+        Remove a previously added share.
+        """
+        if index not in self.indices:
+            raise ValueError("share index not present")
+
+        position = self.indices.index(index)
+        later = self._shares[position + 1:]
+
+        # The Newton form of the first position shares is unaffected.
+        for term in self._terms[position:]:
+            self._value ^= term
+
+        del self._shares[position:]
+        del self._coefficients[position:]
+        del self._terms[position:]
+
+        if not self._shares:
+            self._length = None
+
+        for share_index, data in later:
+            self.add(share_index, data)
+
+    def secret(self) -> bytes:
+        """
+        Return the secret interpolated from the first threshold shares.
+        """
+        if not self.complete:
+            raise ValueError("insufficient number of shares")
+
+        return self._value.to_bytes(self._length, "little")
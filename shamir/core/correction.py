@@ -0,0 +1,296 @@
+"""
+Error-correcting recovery for Shamir shares over GF(256).
+
+Shamir shares of one byte position are a Reed-Solomon codeword, so
+surplus shares allow corrupted shares to be located and excluded
+rather than found by trying share subsets. With n shares and
+threshold t, up to (n - t) // 2 corrupted shares are corrected.
+
+Decoding is driven by whole-row consistency checks: the first byte
+position on which the trusted shares disagree is decoded with
+Berlekamp-Welch, the shares found to be wrong there are excluded,
+and the check is repeated until the remaining shares agree.
+
+check_consistency runs the same whole-row comparison on its own, so
+surplus shares can be checked cheaply before any decryption.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from . import kernels
+from .exceptions import (
+    DuplicateShareIndex,
+    InconsistentShareLength,
+    InterpolationError,
+)
+from .gf256 import add, inv, mul
+from .polynomial import (
+    barycentric_basis,
+    barycentric_weights,
+    basis_weights,
+    evaluate,
+)
+
+
+def _solve(matrix: List[List[int]], rhs: List[int]) -> Optional[List[int]]:
+    """
+    Solve a linear system over GF(256) by Gaussian elimination.
+
+    Free variables are set to zero. Returns None if the system is
+    inconsistent.
+    """
+    rows = [row[:] + [value] for row, value in zip(matrix, rhs)]
+    width = len(matrix[0]) if matrix else 0
+    pivots = []
+    rank = 0
+
+    for column in range(width):
+        pivot = next(
+            (r for r in range(rank, len(rows)) if rows[r][column]),
+            None,
+        )
+        if pivot is None:
+            continue
+
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        factor = inv(rows[rank][column])
+        rows[rank] = [mul(factor, value) for value in rows[rank]]
+
+        for r in range(len(rows)):
+            if r != rank and rows[r][column]:
+                scale = rows[r][column]
+                rows[r] = [
+                    add(value, mul(scale, lead))
+                    for value, lead in zip(rows[r], rows[rank])
+                ]
+
+        pivots.append(column)
+        rank += 1
+
+    if any(row[-1] for row in rows[rank:]):
+        return None
+
+    solution = [0] * width
+    for r, column in enumerate(pivots):
+        solution[column] = rows[r][-1]
+    return solution
+
+
+def _divide(numerator: List[int], denominator: List[int]):
+    """Polynomial long division over GF(256); coefficients low to high."""
+    remainder = numerator[:]
+    quotient = [0] * max(len(numerator) - len(denominator) + 1, 1)
+    lead = inv(denominator[-1])
+
+    for shift in range(len(numerator) - len(denominator), -1, -1):
+        c = mul(remainder[shift + len(denominator) - 1], lead)
+        quotient[shift] = c
+        if c:
+            for i, d in enumerate(denominator):
+                remainder[shift + i] = add(remainder[shift + i], mul(c, d))
+
+    return quotient, remainder
+
+
+def berlekamp_welch(
+    points: Sequence[Tuple[int, int]],
+    threshold: int,
+) -> Tuple[List[int], List[int]]:
+    """
+    Decode one byte position with the Berlekamp-Welch algorithm.
+
+    points are (x, y) pairs that should lie on a polynomial of degree
+    below threshold, with at most (len(points) - threshold) // 2 of
+    them wrong. Returns (coefficients, bad_x) where coefficients[0]
+    is the constant term.
+
+    Raises InterpolationError if no such polynomial exists.
+    """
+    n = len(points)
+    errors = (n - threshold) // 2
+    q_len = threshold + errors
+
+    # Unknowns: Q_0..Q_{q_len-1}, E_0..E_{errors-1}; E is monic.
+    matrix = []
+    rhs = []
+    for x, y in points:
+        row = []
+        power = 1
+        for _ in range(q_len):
+            row.append(power)
+            power = mul(power, x)
+        power = 1
+        for _ in range(errors):
+            row.append(mul(y, power))
+            power = mul(power, x)
+        matrix.append(row)
+        rhs.append(mul(y, power))
+
+    solution = _solve(matrix, rhs)
+    if solution is None:
+        raise InterpolationError("too many corrupted shares to decode")
+
+    q = solution[:q_len]
+    e = solution[q_len:] + [1]
+
+    coefficients, remainder = _divide(q, e)
+    if any(remainder) or any(coefficients[threshold:]):
+        raise InterpolationError("too many corrupted shares to decode")
+
+    coefficients = (coefficients + [0] * threshold)[:threshold]
+    bad = [x for x, y in points if evaluate(coefficients, x) != y]
+
+    if len(bad) > errors:
+        raise InterpolationError("too many corrupted shares to decode")
+
+    return coefficients, bad
+
+
+def _residuals(
+    shares: Sequence[Tuple[int, bytes]],
+    threshold: int,
+    length: int,
+) -> List[Tuple[int, int]]:
+    """
+    Compare surplus shares against the first threshold shares.
+
+    Returns (index, residual) for every share after the first
+    threshold, where residual is the XOR of the share row and the
+    interpolated row at its index, as a little-endian integer.
+    """
+    base = shares[:threshold]
+    base_x = [x for x, _ in base]
+    base_rows = [data for _, data in base]
+    weights = barycentric_weights(base_x)
+
+    residuals = []
+    for x, data in shares[threshold:]:
+        predicted = kernels.linear_combination(
+            base_rows,
+            barycentric_basis(base_x, weights, x),
+            length,
+        )
+        residuals.append(
+            (
+                x,
+                int.from_bytes(predicted, "little")
+                ^ int.from_bytes(data, "little"),
+            )
+        )
+
+    return residuals
+
+
+def _first_disagreement(
+    shares: Sequence[Tuple[int, bytes]],
+    threshold: int,
+    length: int,
+) -> Optional[int]:
+    """
+    Return the first byte position where shares disagree, or None.
+    """
+    mismatch = 0
+    for _, residual in _residuals(shares, threshold, length):
+        mismatch |= residual
+
+    if not mismatch:
+        return None
+
+    lowest_bit = (mismatch & -mismatch).bit_length() - 1
+    return lowest_bit // 8
+
+
+def _validate_shares(
+    shares: Sequence[Tuple[int, bytes]],
+    threshold: int,
+) -> int:
+    """Check share count, indices and lengths; return the row length."""
+    if threshold < 2:
+        raise ValueError("threshold must be at least 2")
+    if len(shares) < threshold:
+        raise ValueError("insufficient number of shares")
+
+    indices = [index for index, _ in shares]
+    if len(set(indices)) != len(indices):
+        raise DuplicateShareIndex("duplicate share index")
+
+    length = len(shares[0][1])
+    for _, data in shares:
+        if len(data) != length:
+            raise InconsistentShareLength("inconsistent share lengths")
+
+    return length
+
+
+def check_consistency(
+    shares: Sequence[Tuple[int, bytes]],
+    threshold: int,
+) -> List[int]:
+    """
+    Find surplus shares that disagree with the first threshold shares.
+
+    The first threshold shares define the polynomial; every further
+    share is compared against it at its own index, using barycentric
+    weights over whole rows. Returns the sorted indices of the
+    inconsistent shares, which is empty when all shares agree.
+
+    An empty result does not identify which shares are correct, only
+    that every share lies on the same polynomial.
+    """
+    shares = [(index, bytes(data)) for index, data in shares]
+    length = _validate_shares(shares, threshold)
+
+    return sorted(
+        index
+        for index, residual in _residuals(shares, threshold, length)
+        if residual
+    )
+
+
+def recover_with_errors(
+    shares: Sequence[Tuple[int, bytes]],
+    threshold: int,
+) -> Tuple[bytes, List[int]]:
+    """
+    Recover a secret while locating and excluding corrupted shares.
+
+    Up to (len(shares) - threshold) // 2 corrupted shares are
+    tolerated. Returns (secret, bad_indices) with bad_indices sorted.
+
+    Raises InterpolationError if the shares cannot be decoded.
+    """
+    ordered = sorted(
+        ((index, bytes(data)) for index, data in shares),
+        key=lambda share: share[0],
+    )
+    length = _validate_shares(ordered, threshold)
+
+    limit = (len(ordered) - threshold) // 2
+    bad = set()
+
+    while True:
+        trusted = [share for share in ordered if share[0] not in bad]
+        column = _first_disagreement(trusted, threshold, length)
+        if column is None:
+            break
+
+        _, located = berlekamp_welch(
+            [(index, data[column]) for index, data in ordered],
+            threshold,
+        )
+
+        if not set(located) - bad:
+            raise InterpolationError("too many corrupted shares to decode")
+
+        bad.update(located)
+        if len(bad) > limit:
+            raise InterpolationError("too many corrupted shares to decode")
+
+    trusted = [share for share in ordered if share[0] not in bad][:threshold]
+    secret = kernels.linear_combination(
+        [data for _, data in trusted],
+        basis_weights([index for index, _ in trusted], x=0),
+        length,
+    )
+
+    return secret, sorted(bad)
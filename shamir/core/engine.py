@@ -0,0 +1,218 @@
+"""
+Row engine dispatch for Shamir split and recover.
+
+Selects a row kernel backend and optionally spreads the work across
+processes. GF(256) Shamir is independent across byte positions, so
+rows are cut into column ranges that worker processes handle on
+their own. Input and output rows live in multiprocessing shared
+memory, so payload and share buffers are never pickled.
+
+Backends:
+
+- "auto": NumPy when installed, pure Python otherwise
+- "python": shamir.core.kernels
+- "numpy": shamir.core.vectorized
+
+Results are byte-identical for every backend and worker count.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from . import kernels, vectorized
+from .kernels import Row
+
+
+def row_backend(name: str):
+    """Resolve a backend name to a row kernel module."""
+    if name == "auto":
+        return vectorized if vectorized.AVAILABLE else kernels
+    if name == "python":
+        return kernels
+    if name == "numpy":
+        if not vectorized.AVAILABLE:
+            raise ValueError("NumPy backend is not available")
+        return vectorized
+    raise ValueError(f"unknown row backend: {name}")
+
+
+def _partition(length: int, parts: int) -> List[Tuple[int, int]]:
+    """Cut 0..length into at most parts contiguous column ranges."""
+    step = -(-length // parts)
+    return [(start, min(start + step, length)) for start in range(0, length, step)]
+
+
+def _load_matrix(rows: Sequence[Row], length: int) -> shared_memory.SharedMemory:
+    """Copy rows into a new shared memory block, row after row."""
+    block = shared_memory.SharedMemory(create=True, size=len(rows) * length)
+    for i, row in enumerate(rows):
+        if len(row) != length:
+            block.close()
+            block.unlink()
+            raise ValueError("row lengths differ")
+        block.buf[i * length:(i + 1) * length] = row
+    return block
+
+
+def _evaluate_columns(
+    backend: str,
+    source_name: str,
+    target_name: str,
+    count: int,
+    xs: Tuple[int, ...],
+    length: int,
+    start: int,
+    end: int,
+) -> None:
+    """Worker: evaluate share rows for columns start..end."""
+    source = shared_memory.SharedMemory(name=source_name)
+    target = shared_memory.SharedMemory(name=target_name)
+    try:
+        rows = [
+            bytes(source.buf[r * length + start:r * length + end])
+            for r in range(count)
+        ]
+        shares = row_backend(backend).evaluate_rows(rows, xs, end - start)
+        for i, data in enumerate(shares):
+            target.buf[i * length + start:i * length + end] = data
+    finally:
+        source.close()
+        target.close()
+
+
+def _combine_columns(
+    backend: str,
+    source_name: str,
+    target_name: str,
+    coefficients: Tuple[int, ...],
+    length: int,
+    start: int,
+    end: int,
+) -> None:
+    """Worker: combine share rows for columns start..end."""
+    source = shared_memory.SharedMemory(name=source_name)
+    target = shared_memory.SharedMemory(name=target_name)
+    try:
+        rows = [
+            bytes(source.buf[r * length + start:r * length + end])
+            for r in range(len(coefficients))
+        ]
+        target.buf[start:end] = row_backend(backend).linear_combination(
+            rows, coefficients, end - start
+        )
+    finally:
+        source.close()
+        target.close()
+
+
+def _run(
+    executor: Optional[Executor],
+    workers: int,
+    jobs: List[tuple],
+) -> None:
+    """Run worker jobs on executor, or on a temporary process pool."""
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _run(pool, workers, jobs)
+        return
+
+    futures = [executor.submit(*job) for job in jobs]
+    for future in futures:
+        future.result()
+
+
+def evaluate_rows(
+    rows: Sequence[Row],
+    xs: Sequence[int],
+    length: int,
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+) -> List[bytes]:
+    """
+    Evaluate a row polynomial at every x in xs.
+
+    With workers > 1 the columns are split across worker processes,
+    using executor if given or a temporary process pool otherwise.
+    """
+    kernels_module = row_backend(backend)
+
+    if workers <= 1 or length < workers or not xs:
+        return kernels_module.evaluate_rows(rows, xs, length)
+
+    source = _load_matrix(rows, length)
+    target = shared_memory.SharedMemory(create=True, size=len(xs) * length)
+    try:
+        jobs = [
+            (
+                _evaluate_columns,
+                backend,
+                source.name,
+                target.name,
+                len(rows),
+                tuple(xs),
+                length,
+                start,
+                end,
+            )
+            for start, end in _partition(length, workers)
+        ]
+        _run(executor, workers, jobs)
+
+        return [
+            bytes(target.buf[i * length:(i + 1) * length])
+            for i in range(len(xs))
+        ]
+    finally:
+        source.close()
+        source.unlink()
+        target.close()
+        target.unlink()
+
+
+def linear_combination(
+    rows: Sequence[Row],
+    coefficients: Sequence[int],
+    length: int,
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+) -> bytes:
+    """
+    Compute the XOR of every row scaled by its coefficient.
+
+    With workers > 1 the columns are split across worker processes,
+    using executor if given or a temporary process pool otherwise.
+    """
+    kernels_module = row_backend(backend)
+
+    if workers <= 1 or length < workers or not rows:
+        return kernels_module.linear_combination(rows, coefficients, length)
+
+    source = _load_matrix(rows, length)
+    target = shared_memory.SharedMemory(create=True, size=length)
+    try:
+        jobs = [
+            (
+                _combine_columns,
+                backend,
+                source.name,
+                target.name,
+                tuple(coefficients),
+                length,
+                start,
+                end,
+            )
+            for start, end in _partition(length, workers)
+        ]
+        _run(executor, workers, jobs)
+
+        return bytes(target.buf[:length])
+    finally:
+        source.close()
+        source.unlink()
+        target.close()
+        target.unlink()
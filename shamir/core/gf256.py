@@ -6,11 +6,23 @@ over GF(2^8) using the irreducible polynomial:
 
     x^8 + x^4 + x^3 + x + 1  (0x11B)
 
+Two multiplication backends are provided:
+
+- "table": log/exp and inverse lookup tables built once at import
+  (default, used by mul, pow, and inv)
+- "reference": explicit shift-and-reduce arithmetic without tables,
+  kept for auditing and cross-checking
+
 All operations are deterministic and side‑effect free.
 """
 
+from types import SimpleNamespace
+
 IRREDUCIBLE_POLY = 0x11B
 
+# 0x03 generates the multiplicative group of GF(256) under 0x11B.
+GENERATOR = 0x03
+
 
 def add(a: int, b: int) -> int:
     """Addition in GF(256) (XOR)."""
@@ -22,8 +34,12 @@ def sub(a: int, b: int) -> int:
     return a ^ b
 
 
-def mul(a: int, b: int) -> int:
-    """Multiplication in GF(256)."""
+# ---------------------------------------------------------------------------
+# Reference backend (table-free)
+# ---------------------------------------------------------------------------
+
+def reference_mul(a: int, b: int) -> int:
+    """Multiplication in GF(256) using shift-and-reduce."""
     result = 0
     for _ in range(8):
         if b & 1:
@@ -37,24 +53,118 @@ def mul(a: int, b: int) -> int:
     return result
 
 
-def pow(a: int, exponent: int) -> int:
-    """Exponentiation in GF(256)."""
+def reference_pow(a: int, exponent: int) -> int:
+    """Exponentiation in GF(256) using reference multiplication."""
     result = 1
     while exponent > 0:
         if exponent & 1:
-            result = mul(result, a)
-        a = mul(a, a)
+            result = reference_mul(result, a)
+        a = reference_mul(a, a)
         exponent >>= 1
     return result
 
 
-def inv(a: int) -> int:
+def reference_inv(a: int) -> int:
     """
-    Multiplicative inverse in GF(256).
+    Multiplicative inverse in GF(256) using reference multiplication.
 
     Raises ZeroDivisionError if a == 0.
     """
     if a == 0:
         raise ZeroDivisionError("0 has no multiplicative inverse in GF(256)")
     # Fermat's little theorem: a^(2^8 - 2)
-    return pow(a, 254)
+    return reference_pow(a, 254)
+
+
+# ---------------------------------------------------------------------------
+# Table backend
+# ---------------------------------------------------------------------------
+
+def _build_tables():
+    """
+    Build log/exp and inverse tables using the reference backend.
+
+    EXP is doubled to 510 entries so that EXP[LOG[a] + LOG[b]] never
+    needs a modular reduction.
+    """
+    exp = [0] * 510
+    log = [0] * 256
+
+    value = 1
+    for power in range(255):
+        exp[power] = value
+        log[value] = power
+        value = reference_mul(value, GENERATOR)
+
+    for power in range(255, 510):
+        exp[power] = exp[power - 255]
+
+    inverse = [0] * 256
+    for a in range(1, 256):
+        inverse[a] = exp[255 - log[a]]
+
+    return tuple(exp), tuple(log), tuple(inverse)
+
+
+EXP_TABLE, LOG_TABLE, INV_TABLE = _build_tables()
+
+
+def table_mul(a: int, b: int) -> int:
+    """Multiplication in GF(256) using log/exp tables."""
+    if a == 0 or b == 0:
+        return 0
+    return EXP_TABLE[LOG_TABLE[a] + LOG_TABLE[b]]
+
+
+def table_pow(a: int, exponent: int) -> int:
+    """Exponentiation in GF(256) using log/exp tables."""
+    if exponent == 0:
+        return 1
+    if a == 0:
+        return 0
+    return EXP_TABLE[(LOG_TABLE[a] * exponent) % 255]
+
+
+def table_inv(a: int) -> int:
+    """
+    Multiplicative inverse in GF(256) using the inverse table.
+
+    Raises ZeroDivisionError if a == 0.
+    """
+    if a == 0:
+        raise ZeroDivisionError("0 has no multiplicative inverse in GF(256)")
+    return INV_TABLE[a]
+
+
+# ---------------------------------------------------------------------------
+# Backend selection
+# ---------------------------------------------------------------------------
+
+DEFAULT_BACKEND = "table"
+
+BACKENDS = {
+    "table": SimpleNamespace(mul=table_mul, pow=table_pow, inv=table_inv),
+    "reference": SimpleNamespace(
+        mul=reference_mul,
+        pow=reference_pow,
+        inv=reference_inv,
+    ),
+}
+
+
+def get_backend(name: str = DEFAULT_BACKEND) -> SimpleNamespace:
+    """
+    Return the arithmetic backend registered under name.
+
+    The returned namespace exposes mul, pow, and inv.
+    Raises ValueError for unknown backend names.
+    """
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown GF(256) backend: {name}") from None
+
+
+mul = table_mul
+pow = table_pow
+inv = table_inv
@@ -0,0 +1,95 @@
+"""
+Information dispersal over GF(256).
+
+Implements Rabin's information dispersal algorithm as a systematic
+Reed-Solomon code. Data is padded and cut into threshold equal rows,
+which are taken as the values of a degree threshold-1 row polynomial
+at x = 1..threshold. Fragments at x = threshold+1..total are further
+evaluations of that polynomial, so any threshold fragments determine
+the data while each fragment is only 1/threshold of its size.
+
+Dispersal provides no secrecy; it is meant for data that is already
+encrypted.
+"""
+
+from typing import List, Sequence, Tuple
+
+from . import engine
+from .polynomial import basis_weights
+
+
+def _pad(data: bytes, threshold: int) -> bytes:
+    """Append 0x80 and zero bytes up to a multiple of threshold."""
+    padded = bytes(data) + b"\x80"
+    return padded + bytes(-len(padded) % threshold)
+
+
+def _unpad(padded: bytes) -> bytes:
+    data = padded.rstrip(b"\x00")
+    if not data.endswith(b"\x80"):
+        raise ValueError("invalid dispersal padding")
+    return data[:-1]
+
+
+def disperse(data: bytes, threshold: int, total: int) -> List[Tuple[int, bytes]]:
+    """
+    Disperse data into total fragments, any threshold of which suffice.
+
+    Fragments 1..threshold are the padded data rows themselves.
+    Returns a list of (index, fragment_bytes) tuples.
+    """
+    if threshold < 1:
+        raise ValueError("threshold must be at least 1")
+    if total < threshold:
+        raise ValueError("total must be >= threshold")
+    if total > 255:
+        raise ValueError("total must be <= 255")
+
+    padded = _pad(data, threshold)
+    width = len(padded) // threshold
+
+    rows = [padded[j * width:(j + 1) * width] for j in range(threshold)]
+    base = list(range(1, threshold + 1))
+
+    fragments = list(zip(base, rows))
+    for x in range(threshold + 1, total + 1):
+        weights = basis_weights(base, x=x)
+        fragments.append((x, engine.linear_combination(rows, weights, width)))
+
+    return fragments
+
+
+def reconstruct(fragments: Sequence[Tuple[int, bytes]], threshold: int) -> bytes:
+    """
+    Reconstruct dispersed data from at least threshold fragments.
+
+    Only the lowest threshold indices are used.
+    """
+    if threshold < 1:
+        raise ValueError("threshold must be at least 1")
+
+    chosen = sorted(fragments, key=lambda fragment: fragment[0])[:threshold]
+    if len(chosen) < threshold:
+        raise ValueError("insufficient number of fragments")
+
+    xs = [index for index, _ in chosen]
+    if len(set(xs)) != len(xs):
+        raise ValueError("duplicate fragment index")
+
+    width = len(chosen[0][1])
+    for _, data in chosen:
+        if len(data) != width:
+            raise ValueError("inconsistent fragment lengths")
+
+    available = dict(chosen)
+    values = [bytes(data) for _, data in chosen]
+
+    rows = []
+    for j in range(1, threshold + 1):
+        if j in available:
+            rows.append(bytes(available[j]))
+        else:
+            weights = basis_weights(xs, x=j)
+            rows.append(engine.linear_combination(values, weights, width))
+
+    return _unpad(b"".join(rows))
@@ -0,0 +1,123 @@
+"""
+Whole-row GF(256) kernels.
+
+Multiplying every byte of a buffer by the same field constant is a
+pure byte substitution, so it is expressed as bytes.translate over
+one of 256 precomputed translation tables. Row addition is XOR over
+the whole buffer, performed on arbitrary-precision integers.
+
+These kernels move the per-byte loops of split and recover out of
+Python bytecode and into C-level memory operations. Results are
+identical to applying gf256.mul and gf256.add byte by byte.
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from .gf256 import mul, pow
+
+
+Row = Union[bytes, bytearray, memoryview]
+
+
+def _build_scale_tables():
+    """Build one 256-byte translation table per field constant."""
+    return tuple(
+        bytes(mul(c, value) for value in range(256))
+        for c in range(256)
+    )
+
+
+SCALE_TABLES = _build_scale_tables()
+
+
+def scale(buf: Row, c: int) -> bytes:
+    """
+    Multiply every byte of buf by the field constant c.
+    """
+    if isinstance(buf, memoryview):
+        buf = buf.tobytes()
+    return buf.translate(SCALE_TABLES[c])
+
+
+def xor_into(acc: bytearray, buf: Row) -> None:
+    """
+    Add buf to acc in place (XOR).
+
+    Both buffers must have equal length.
+    """
+    if len(acc) != len(buf):
+        raise ValueError("row lengths differ")
+
+    length = len(acc)
+    value = int.from_bytes(acc, "little") ^ int.from_bytes(buf, "little")
+    acc[:] = value.to_bytes(length, "little")
+
+
+def linear_combination(
+    rows: Sequence[Row],
+    coefficients: Iterable[int],
+    length: int,
+) -> bytes:
+    """
+    Compute the XOR of every row scaled by its coefficient.
+
+    All rows must be exactly length bytes long.
+    """
+    acc = 0
+    for row, c in zip(rows, coefficients):
+        if len(row) != length:
+            raise ValueError("row lengths differ")
+        if c == 0:
+            continue
+        if c != 1:
+            row = scale(row, c)
+        acc ^= int.from_bytes(row, "little")
+    return acc.to_bytes(length, "little")
+
+
+def horner(rows: Sequence[Row], x: int, length: int) -> bytes:
+    """
+    Evaluate a row polynomial at x using Horner's method.
+
+    rows[0] is the constant row; every row must be length bytes long.
+    """
+    acc = bytes(length)
+    for row in reversed(rows):
+        if len(row) != length:
+            raise ValueError("row lengths differ")
+        scaled = acc.translate(SCALE_TABLES[x])
+        acc = (
+            int.from_bytes(scaled, "little") ^ int.from_bytes(row, "little")
+        ).to_bytes(length, "little")
+    return acc
+
+
+@lru_cache(maxsize=128)
+def power_table(threshold: int, total: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Vandermonde power table for a (threshold, total) split.
+
+    Entry [x][j] is x^j for every x in 0..total and j in
+    0..threshold-1, so a share row at x is the XOR of coefficient
+    row j scaled by power_table[x][j].
+    """
+    return tuple(
+        tuple(pow(x, j) for j in range(threshold))
+        for x in range(total + 1)
+    )
+
+
+def evaluate_rows(
+    rows: Sequence[Row],
+    xs: Sequence[int],
+    length: int,
+) -> List[bytes]:
+    """
+    Evaluate a row polynomial at every x in xs.
+
+    rows[0] is the constant row. Returns one share row per x, each
+    built as a Vandermonde combination of the coefficient rows.
+    """
+    powers = power_table(len(rows), max(xs, default=0))
+    return [linear_combination(rows, powers[x], length) for x in xs]
@@ -0,0 +1,131 @@
+"""
+Packed (ramp) Shamir Secret Sharing over GF(256).
+
+Embeds count secrets of equal length into one row polynomial of
+degree privacy + count - 1. Secret j is the value of the polynomial
+at x = 255 - j, outside the share index range, and the remaining
+degrees of freedom are uniformly random. Consequently:
+
+- any privacy shares reveal nothing about the secrets
+- any privacy + count shares reconstruct all count secrets
+- sets in between leak partial information (the ramp)
+
+Each share is as long as one secret, so storage and work per secret
+shrink by a factor of count compared to splitting every secret on
+its own. privacy is the explicit security parameter: it plays the
+role of threshold - 1 in ordinary Shamir.
+"""
+
+from typing import List, Sequence, Tuple
+
+from . import engine
+from .polynomial import barycentric_basis, barycentric_weights
+from .shamir import _coefficient_rows
+
+
+def secret_points(count: int) -> List[int]:
+    """Evaluation points holding the secrets: 255, 254, ..."""
+    return [255 - j for j in range(count)]
+
+
+def _validate_policy(count: int, privacy: int, total: int) -> None:
+    if count < 1:
+        raise ValueError("at least one secret is required")
+    if privacy < 1:
+        raise ValueError("privacy must be at least 1")
+    if total < privacy + count:
+        raise ValueError("total must be >= privacy + count")
+    if total + count > 255:
+        raise ValueError("total + count must not exceed 255")
+
+
+def split_packed(
+    secrets: Sequence[bytes],
+    privacy: int,
+    total: int,
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+) -> List[Tuple[int, bytes]]:
+    """
+    Split equal-length secrets into packed shares.
+
+    Any privacy + len(secrets) shares reconstruct every secret; any
+    privacy shares reveal nothing. Returns a list of (index,
+    share_bytes) tuples for indices 1..total.
+    """
+    count = len(secrets)
+    _validate_policy(count, privacy, total)
+
+    length = len(secrets[0])
+    for secret in secrets:
+        if len(secret) != length:
+            raise ValueError("secrets must have equal length")
+
+    # Shares 1..privacy are uniform and, with the secret points, fix
+    # the polynomial; the other shares are evaluations of it.
+    random_rows = [bytes(row) for row in _coefficient_rows(length, privacy)]
+    nodes = list(range(1, privacy + 1)) + secret_points(count)
+    rows = random_rows + [bytes(secret) for secret in secrets]
+    weights = barycentric_weights(nodes)
+
+    shares = list(zip(range(1, privacy + 1), random_rows))
+    for x in range(privacy + 1, total + 1):
+        data = engine.linear_combination(
+            rows,
+            barycentric_basis(nodes, weights, x),
+            length,
+            backend=backend,
+            workers=workers,
+        )
+        shares.append((x, data))
+
+    return shares
+
+
+def recover_packed(
+    shares: Sequence[Tuple[int, bytes]],
+    count: int,
+    privacy: int,
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+) -> List[bytes]:
+    """
+    Reconstruct all count secrets from packed shares.
+
+    Uses the first privacy + count shares. Barycentric weights for
+    their indices are computed once and evaluated at every secret
+    point. Returns the secrets in split order.
+    """
+    threshold = privacy + count
+    if len(shares) < threshold:
+        raise ValueError("insufficient number of shares")
+    if any(not 1 <= index <= 255 for index, _ in shares):
+        raise ValueError("share index must be in 1..255")
+
+    selected = list(shares)[:threshold]
+    xs = [index for index, _ in selected]
+    if len(set(xs)) != len(xs):
+        raise ValueError("duplicate share index")
+    if any(x in secret_points(count) for x in xs):
+        raise ValueError("share index collides with a secret point")
+
+    length = len(selected[0][1])
+    for _, data in selected:
+        if len(data) != length:
+            raise ValueError("inconsistent share lengths")
+
+    rows = [bytes(data) for _, data in selected]
+    weights = barycentric_weights(xs)
+
+    return [
+        engine.linear_combination(
+            rows,
+            barycentric_basis(xs, weights, x),
+            length,
+            backend=backend,
+            workers=workers,
+        )
+        for x in secret_points(count)
+    ]
@@ -47,3 +47,71 @@ def interpolate(points: List[Tuple[int, int]], x: int = 0) -> int:
         result = add(result, term)
 
     return result
+
+
+def basis_weights(xs: List[int], x: int = 0) -> List[int]:
+    """
+    Lagrange basis weights at point x (default: 0).
+
+    The interpolated value at x is the sum of weights[i] * y_i, so the
+    weights can be computed once and reused for every byte position
+    sharing the same x coordinates.
+
+    Raises ZeroDivisionError if duplicate x coordinates are provided.
+    """
+    weights = []
+
+    for i, xi in enumerate(xs):
+        numerator = 1
+        denominator = 1
+
+        for j, xj in enumerate(xs):
+            if i == j:
+                continue
+            numerator = mul(numerator, add(x, xj))
+            denominator = mul(denominator, add(xi, xj))
+
+        weights.append(mul(numerator, inv(denominator)))
+
+    return weights
+
+
+def barycentric_weights(xs: List[int]) -> List[int]:
+    """
+    Barycentric weights for the interpolation nodes xs.
+
+    weights[j] is the inverse of the product of (xs[j] - xs[k]) over
+    every k != j. Computed once in O(t^2), they let basis values at
+    any further point be derived in O(t) with barycentric_basis.
+
+    Raises ZeroDivisionError if duplicate x coordinates are provided.
+    """
+    weights = []
+
+    for j, xj in enumerate(xs):
+        denominator = 1
+        for k, xk in enumerate(xs):
+            if j != k:
+                denominator = mul(denominator, add(xj, xk))
+        weights.append(inv(denominator))
+
+    return weights
+
+
+def barycentric_basis(xs: List[int], weights: List[int], x: int) -> List[int]:
+    """
+    Lagrange basis values at x from precomputed barycentric weights.
+
+    Equal to basis_weights(xs, x), in O(t) instead of O(t^2).
+    """
+    if x in xs:
+        return [1 if xj == x else 0 for xj in xs]
+
+    node = 1
+    for xj in xs:
+        node = mul(node, add(x, xj))
+
+    return [
+        mul(node, mul(wj, inv(add(x, xj))))
+        for xj, wj in zip(xs, weights)
+    ]
@@ -0,0 +1,124 @@
+"""
+Threshold re-sharing over GF(256).
+
+Moves a secret from a (t, n) policy to a (t', n') policy without
+reconstructing it in one place. Each of t current custodians splits
+its own share into n' sub-shares under the new threshold and sends
+sub-share j to new custodian j. New custodian j combines the t
+sub-shares it receives with the Lagrange weights of the old indices
+at x = 0, which yields a share of the original secret on a fresh
+polynomial of degree t' - 1.
+
+Both steps work on whole rows, and the Lagrange weights depend only
+on the old index set, so they are computed once per set.
+"""
+
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from . import engine
+from .polynomial import basis_weights
+from .shamir import split
+
+
+@lru_cache(maxsize=64)
+def _combine_weights(old_indices: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Lagrange weights at x = 0 for one set of old share indices."""
+    return tuple(basis_weights(list(old_indices), x=0))
+
+
+def subshare(
+    data: bytes,
+    new_threshold: int,
+    new_total: int,
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+) -> List[Tuple[int, bytes]]:
+    """
+    Split the data of one current share into sub-shares.
+
+    Run by each of the t current custodians. Returns one (new_index,
+    sub_share_bytes) tuple per new custodian.
+    """
+    return split(
+        data,
+        new_threshold,
+        new_total,
+        backend=backend,
+        workers=workers,
+    )
+
+
+def combine_subshares(
+    subshares: Sequence[Tuple[int, bytes]],
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+) -> bytes:
+    """
+    Combine the sub-shares received by one new custodian.
+
+    subshares holds (old_index, sub_share_bytes) pairs, one from each
+    of exactly threshold current custodians. Returns the new share
+    bytes at the custodian's new index.
+    """
+    if not subshares:
+        raise ValueError("no sub-shares provided")
+
+    ordered = sorted(subshares, key=lambda subshare: subshare[0])
+    old_indices = tuple(index for index, _ in ordered)
+    if len(set(old_indices)) != len(old_indices):
+        raise ValueError("duplicate share index")
+
+    length = len(ordered[0][1])
+    for _, data in ordered:
+        if len(data) != length:
+            raise ValueError("inconsistent share lengths")
+
+    return engine.linear_combination(
+        [bytes(data) for _, data in ordered],
+        _combine_weights(old_indices),
+        length,
+        backend=backend,
+        workers=workers,
+    )
+
+
+def reshare(
+    shares: Sequence[Tuple[int, bytes]],
+    new_threshold: int,
+    new_total: int,
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+) -> List[Tuple[int, bytes]]:
+    """
+    Re-share a secret from threshold current shares to a new policy.
+
+    Runs both re-sharing steps in one process. Exactly threshold
+    current shares must be given. Returns a list of (index,
+    share_bytes) tuples for indices 1..new_total.
+    """
+    if not shares:
+        raise ValueError("no shares provided")
+
+    received = {new_index: [] for new_index in range(1, new_total + 1)}
+
+    for index, data in shares:
+        for new_index, sub_data in subshare(
+            data,
+            new_threshold,
+            new_total,
+            backend=backend,
+            workers=workers,
+        ):
+            received[new_index].append((index, sub_data))
+
+    return [
+        (
+            new_index,
+            combine_subshares(subshares, backend=backend, workers=workers),
+        )
+        for new_index, subshares in received.items()
+    ]
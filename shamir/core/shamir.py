@@ -3,16 +3,86 @@ Shamir Secret Sharing core logic.
 
 Provides deterministic split and recover primitives operating
 strictly over GF(256) and polynomial arithmetic.
+
+Both operations work on whole share rows: every coefficient of the
+byte-wise polynomials is stored as a row spanning the full secret,
+and the row kernels apply one field operation to all byte positions
+at once.
+
+Row kernels are selected with the backend argument:
+
+- "auto": NumPy when installed, pure Python otherwise (default)
+- "python": shamir.core.kernels
+- "numpy": shamir.core.vectorized
+
+With workers > 1 byte positions are split across worker processes
+(see shamir.core.engine); output is identical to the serial path.
+
+A total-of-total split takes a dedicated serial path: shares
+1..total-1 are drawn uniformly at random and the last one is solved
+for, O(total * len) instead of O(total^2 * len). The shares have the
+same distribution as on the general path, and recover is unchanged.
 """
 
-import secrets
-from typing import List, Tuple
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from shamir.aead import encrypt_many
+
+from . import engine
+from .correction import check_consistency
+from .gf256 import inv
+from .polynomial import barycentric_basis, barycentric_weights, basis_weights
+
+
+def _coefficient_rows(length: int, count: int) -> List[memoryview]:
+    """
+    Draw count uniformly random coefficient rows of length bytes.
+
+    All randomness comes from a single os.urandom call; rows are
+    zero-copy memoryview slices of that buffer.
+    """
+    pool = memoryview(os.urandom(length * count))
+    return [pool[i * length:(i + 1) * length] for i in range(count)]
 
-from .gf256 import add
-from .polynomial import evaluate, interpolate
 
+@lru_cache(maxsize=64)
+def _zero_weights(total: int) -> Tuple[int, ...]:
+    """Lagrange weights at x = 0 for indices 1..total."""
+    return tuple(basis_weights(list(range(1, total + 1)), x=0))
 
-def split(secret: bytes, threshold: int, total: int) -> List[Tuple[int, bytes]]:
+
+def _split_all(rows_module, secret: bytes, total: int) -> List[Tuple[int, bytes]]:
+    """
+    total-of-total split.
+
+    With every share required, shares 1..total-1 of a random
+    polynomial are independent and uniform, so they are drawn directly
+    and the last share is solved from the Lagrange relation at x = 0.
+    """
+    length = len(secret)
+    rows = [bytes(row) for row in _coefficient_rows(length, total - 1)]
+    weights = _zero_weights(total)
+
+    partial = rows_module.linear_combination(rows, weights[:-1], length)
+    scale = inv(weights[-1])
+    last = rows_module.linear_combination(
+        [bytes(secret), partial], [scale, scale], length
+    )
+
+    return list(zip(range(1, total + 1), rows + [last]))
+
+
+def split(
+    secret: bytes,
+    threshold: int,
+    total: int,
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+) -> List[Tuple[int, bytes]]:
     """
     Split a secret into shares using Shamir Secret Sharing.
 
@@ -23,21 +93,125 @@ def split(secret: bytes, threshold: int, total: int) -> List[Tuple[int, bytes]]:
     if total < threshold:
         raise ValueError("total must be >= threshold")
 
-    shares = [(i + 1, bytearray()) for i in range(total)]
+    if threshold == total and workers <= 1:
+        return _split_all(engine.row_backend(backend), secret, total)
+
+    length = len(secret)
+    rows = [bytes(secret)] + _coefficient_rows(length, threshold - 1)
+
+    indices = list(range(1, total + 1))
+    data = engine.evaluate_rows(
+        rows,
+        indices,
+        length,
+        backend=backend,
+        workers=workers,
+    )
+
+    return list(zip(indices, data))
+
+
+SELECTION_POLICIES = ("first", "lowest", "explicit")
+
+
+def select_shares(
+    shares: Sequence[Tuple[int, bytes]],
+    threshold: int,
+    policy: str = "lowest",
+    indices: Optional[Sequence[int]] = None,
+) -> Tuple[List[Tuple[int, bytes]], List[Tuple[int, bytes]]]:
+    """
+    Pick exactly threshold shares for reconstruction.
+
+    Policies:
+
+    - "first": the first threshold shares in the given order
+    - "lowest": the threshold shares with the lowest indices
+    - "explicit": the shares at indices, which must name exactly
+      threshold supplied shares
+
+    Interpolating over more than threshold shares gives the same result
+    at a higher cost. Returns (selected, unused); unused shares may
+    still be used for a consistency check.
+    """
+    if threshold < 2:
+        raise ValueError("threshold must be at least 2")
+    if policy not in SELECTION_POLICIES:
+        raise ValueError(f"unknown selection policy: {policy}")
+    if len(shares) < threshold:
+        raise ValueError("insufficient number of shares")
+
+    if policy == "first":
+        order = list(shares)
+    elif policy == "lowest":
+        order = sorted(shares, key=lambda share: share[0])
+    else:
+        if indices is None or len(indices) != threshold:
+            raise ValueError("explicit selection must name threshold indices")
+        if len(set(indices)) != len(indices):
+            raise ValueError("duplicate share index")
+
+        by_index = {index: (index, data) for index, data in shares}
+        missing = [index for index in indices if index not in by_index]
+        if missing:
+            raise ValueError(f"selected shares not supplied: {missing}")
+
+        chosen = set(indices)
+        order = [by_index[index] for index in indices] + [
+            share for share in shares if share[0] not in chosen
+        ]
+
+    return order[:threshold], order[threshold:]
+
 
-    for byte in secret:
-        coefficients = [byte] + [secrets.randbelow(256) for _ in range(threshold - 1)]
-        for index, buffer in shares:
-            buffer.append(evaluate(coefficients, index))
+def select_for_recovery(
+    shares: Sequence[Tuple[int, bytes]],
+    threshold: Optional[int] = None,
+    policy: Optional[str] = None,
+    indices: Optional[Sequence[int]] = None,
+    check: bool = False,
+) -> List[Tuple[int, bytes]]:
+    """
+    Apply the share selection arguments of recover().
+
+    Without threshold every share is kept, and giving policy, indices
+    or check is an error. With threshold, select_shares picks the
+    shares ("lowest" unless policy says otherwise); with check=True
+    the unused shares must lie on the same polynomial as the chosen
+    ones.
+    """
+    if threshold is None:
+        if policy is not None or indices is not None or check:
+            raise ValueError("share selection requires a threshold")
+        return list(shares)
+
+    selected, unused = select_shares(
+        shares, threshold, policy or "lowest", indices
+    )
+    if check and unused:
+        inconsistent = check_consistency(selected + unused, threshold)
+        if inconsistent:
+            raise ValueError(f"inconsistent shares: {inconsistent}")
 
-    return [(index, bytes(buffer)) for index, buffer in shares]
+    return selected
 
 
-def recover(shares: List[Tuple[int, bytes]]) -> bytes:
+def recover(
+    shares: List[Tuple[int, bytes]],
+    *,
+    threshold: Optional[int] = None,
+    policy: Optional[str] = None,
+    indices: Optional[Sequence[int]] = None,
+    check: bool = False,
+    backend: str = "auto",
+    workers: int = 1,
+) -> bytes:
     """
     Recover the original secret from shares.
 
-    All shares must have equal length.
+    All shares must have equal length. Without threshold every share
+    is interpolated. With threshold exactly threshold shares are chosen
+    by policy (see select_for_recovery).
     """
     if not shares:
         raise ValueError("no shares provided")
@@ -47,10 +221,298 @@ def recover(shares: List[Tuple[int, bytes]]) -> bytes:
         if len(data) != length:
             raise ValueError("inconsistent share lengths")
 
-    secret = bytearray()
+    shares = select_for_recovery(shares, threshold, policy, indices, check)
+
+    weights = basis_weights([index for index, _ in shares], x=0)
+
+    return engine.linear_combination(
+        [bytes(data) for _, data in shares],
+        weights,
+        length,
+        backend=backend,
+        workers=workers,
+    )
+
+
+@dataclass(frozen=True)
+class ShareBatch:
+    """
+    Shares for a batch of secrets split under one policy.
+
+    rows[i] holds the concatenated share bytes at indices[i] for every
+    secret in the batch; secret k occupies offsets[k]:offsets[k + 1].
+    """
+
+    threshold: int
+    indices: Tuple[int, ...]
+    offsets: Tuple[int, ...]
+    rows: Tuple[bytes, ...]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[List[Tuple[int, bytes]]]:
+        for position in range(len(self)):
+            yield self.shares(position)
+
+    def shares(self, position: int) -> List[Tuple[int, bytes]]:
+        """Return the (index, share_bytes) list for one secret."""
+        if not 0 <= position < len(self):
+            raise IndexError("secret position out of range")
+
+        start = self.offsets[position]
+        end = self.offsets[position + 1]
+
+        return [
+            (index, row[start:end])
+            for index, row in zip(self.indices, self.rows)
+        ]
+
+
+def split_many(
+    secrets: Sequence[bytes],
+    threshold: int,
+    total: int,
+    *,
+    authenticated: bool = False,
+    associated_data: Optional[bytes] = None,
+    backend: str = "auto",
+    workers: int = 1,
+) -> ShareBatch:
+    """
+    Split a batch of secrets under the same threshold policy.
+
+    The batch is treated as one matrix: secrets are laid out side by
+    side in a single row, coefficient randomness is drawn once for the
+    whole batch, and every share row is evaluated in one pass with the
+    shared power table. Each secret's shares are identical in
+    distribution to a separate split() call.
+
+    If authenticated is enabled, every secret is first encrypted on its
+    own with shamir.aead.encrypt_many, in one pass over the batch, and
+    the AEAD payloads are split instead.
+    """
+    if threshold < 2:
+        raise ValueError("threshold must be at least 2")
+    if total < threshold:
+        raise ValueError("total must be >= threshold")
+
+    if authenticated:
+        secrets = encrypt_many(secrets, associated_data)
+
+    offsets = [0]
+    for secret in secrets:
+        offsets.append(offsets[-1] + len(secret))
+
+    length = offsets[-1]
+    rows = [b"".join(secrets)] + _coefficient_rows(length, threshold - 1)
+
+    indices = tuple(range(1, total + 1))
+    data = engine.evaluate_rows(
+        rows,
+        indices,
+        length,
+        backend=backend,
+        workers=workers,
+    )
+
+    return ShareBatch(
+        threshold=threshold,
+        indices=indices,
+        offsets=tuple(offsets),
+        rows=tuple(data),
+    )
+
+
+def recover_many(
+    share_sets: Iterable[Sequence[Tuple[int, bytes]]],
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+) -> List[bytes]:
+    """
+    Recover a batch of secrets, one per share set.
+
+    Share sets are grouped by their sorted index tuple. Lagrange
+    weights are computed once per group, and all secrets of a group
+    are reconstructed in one pass over rows that concatenate the
+    group's shares side by side. A ShareBatch can be passed directly.
+
+    Returns the secrets in input order.
+    """
+    groups: Dict[Tuple[int, ...], List[int]] = {}
+    ordered_sets = []
+
+    for position, shares in enumerate(share_sets):
+        if not shares:
+            raise ValueError("no shares provided")
+
+        ordered = sorted(shares, key=lambda share: share[0])
+        length = len(ordered[0][1])
+        for _, data in ordered:
+            if len(data) != length:
+                raise ValueError("inconsistent share lengths")
+
+        ordered_sets.append(ordered)
+        key = tuple(index for index, _ in ordered)
+        groups.setdefault(key, []).append(position)
+
+    results: List[bytes] = [b""] * len(ordered_sets)
+
+    for key, positions in groups.items():
+        weights = basis_weights(list(key), x=0)
+
+        offsets = [0]
+        for position in positions:
+            offsets.append(offsets[-1] + len(ordered_sets[position][0][1]))
+
+        rows = [
+            b"".join(bytes(ordered_sets[position][i][1]) for position in positions)
+            for i in range(len(key))
+        ]
+
+        combined = engine.linear_combination(
+            rows,
+            weights,
+            offsets[-1],
+            backend=backend,
+            workers=workers,
+        )
+
+        for k, position in enumerate(positions):
+            results[position] = combined[offsets[k]:offsets[k + 1]]
+
+    return results
+
+
+def refresh_shares(
+    shares: Sequence[Tuple[int, bytes]],
+    threshold: int,
+    *,
+    backend: str = "auto",
+    workers: int = 1,
+) -> List[Tuple[int, bytes]]:
+    """
+    Re-randomize shares without recovering the secret.
+
+    Adds to every share the evaluation, at its index, of a fresh random
+    polynomial of degree threshold - 1 with a zero constant term. The
+    refreshed shares encode the same secret under the same policy, and
+    cannot be combined with shares from before the refresh.
+
+    All shares of the secret must be refreshed together. Returns a list
+    of (index, share_bytes) tuples in input order.
+    """
+    if threshold < 2:
+        raise ValueError("threshold must be at least 2")
+    if not shares:
+        raise ValueError("no shares provided")
+
+    xs = [index for index, _ in shares]
+    if len(set(xs)) != len(xs):
+        raise ValueError("duplicate share index")
+
+    length = len(shares[0][1])
+    for _, data in shares:
+        if len(data) != length:
+            raise ValueError("inconsistent share lengths")
+
+    rows = [bytes(length)] + _coefficient_rows(length, threshold - 1)
+    deltas = engine.evaluate_rows(
+        rows,
+        xs,
+        length,
+        backend=backend,
+        workers=workers,
+    )
+
+    return [
+        (
+            index,
+            (
+                int.from_bytes(data, "little") ^ int.from_bytes(delta, "little")
+            ).to_bytes(length, "little"),
+        )
+        for (index, data), delta in zip(shares, deltas)
+    ]
+
+
+@lru_cache(maxsize=64)
+def _repair_basis(
+    xs: Tuple[int, ...],
+    targets: Tuple[int, ...],
+) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Lagrange basis values of nodes xs at every target index.
+
+    Barycentric weights are computed once for xs, after which each
+    target costs O(len(xs)).
+    """
+    weights = barycentric_weights(list(xs))
+    return tuple(
+        tuple(barycentric_basis(list(xs), weights, x))
+        for x in targets
+    )
+
+
+def repair_shares(
+    shares: Sequence[Tuple[int, bytes]],
+    missing_indices: Sequence[int],
+    *,
+    threshold: Optional[int] = None,
+    total: Optional[int] = None,
+    backend: str = "auto",
+    workers: int = 1,
+) -> List[Tuple[int, bytes]]:
+    """
+    Regenerate the shares at missing_indices without recovering the secret.
+
+    The polynomial interpolating the given shares is evaluated directly
+    at every missing index. Exactly threshold shares should be given:
+    fewer cannot determine the polynomial, and extra shares only add
+    work. If threshold is given, fewer shares are rejected; if total is
+    given, every missing index must lie in 1..total.
+
+    Returns a list of (index, share_bytes) tuples in missing_indices
+    order.
+    """
+    if not shares:
+        raise ValueError("no shares provided")
+    if threshold is not None and len(shares) < threshold:
+        raise ValueError("insufficient number of shares")
+
+    ordered = sorted(shares, key=lambda share: share[0])
+    xs = tuple(index for index, _ in ordered)
+    if len(set(xs)) != len(xs):
+        raise ValueError("duplicate share index")
+
+    targets = tuple(missing_indices)
+    if len(set(targets)) != len(targets):
+        raise ValueError("duplicate missing index")
+    limit = 255 if total is None else total
+    for x in targets:
+        if not 1 <= x <= limit:
+            raise ValueError(f"share index must be in 1..{limit}")
+        if x in xs:
+            raise ValueError("share index is not missing")
+
+    length = len(ordered[0][1])
+    for _, data in ordered:
+        if len(data) != length:
+            raise ValueError("inconsistent share lengths")
 
-    for i in range(length):
-        points = [(index, data[i]) for index, data in shares]
-        secret.append(interpolate(points, x=0))
+    rows = [bytes(data) for _, data in ordered]
 
-    return bytes(secret)
+    return [
+        (
+            x,
+            engine.linear_combination(
+                rows,
+                basis,
+                length,
+                backend=backend,
+                workers=workers,
+            ),
+        )
+        for x, basis in zip(targets, _repair_basis(xs, targets))
+    ]
@@ -0,0 +1,123 @@
+"""
+Optional NumPy-vectorized GF(256) row kernels.
+
+Share rows are held as uint8 arrays. Element-wise multiplication uses
+the log/exp tables from gf256 through fancy indexing; multiplying a
+whole row by one constant gathers from that constant's row of the
+precomputed product table. Row sums are XOR reductions across the
+share axis.
+
+NumPy is an optional dependency. When it is not installed, AVAILABLE
+is False and callers must fall back to the pure-Python kernels in
+shamir.core.kernels, which produce identical results.
+"""
+
+from typing import List, Sequence, Union
+
+from .gf256 import EXP_TABLE, LOG_TABLE
+from .kernels import SCALE_TABLES, power_table
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+
+AVAILABLE = np is not None
+
+Row = Union[bytes, bytearray, memoryview]
+
+if AVAILABLE:
+    _EXP = np.array(EXP_TABLE, dtype=np.uint8)
+    _LOG = np.array(LOG_TABLE, dtype=np.uint16)
+    _PRODUCTS = np.frombuffer(b"".join(SCALE_TABLES), dtype=np.uint8)
+    _PRODUCTS = _PRODUCTS.reshape(256, 256)
+
+
+def _require_numpy() -> None:
+    if not AVAILABLE:
+        raise ValueError("NumPy backend is not available")
+
+
+def _as_matrix(rows: Sequence[Row], length: int):
+    """Stack byte rows into a (len(rows), length) uint8 matrix."""
+    matrix = np.empty((len(rows), length), dtype=np.uint8)
+    for i, row in enumerate(rows):
+        if len(row) != length:
+            raise ValueError("row lengths differ")
+        matrix[i] = np.frombuffer(row, dtype=np.uint8)
+    return matrix
+
+
+def mul(a, b):
+    """
+    Element-wise multiplication in GF(256) on uint8 arrays.
+
+    Either operand may be a scalar or an array; NumPy broadcasting
+    rules apply.
+    """
+    _require_numpy()
+    a = np.asarray(a, dtype=np.uint8)
+    b = np.asarray(b, dtype=np.uint8)
+    product = _EXP[_LOG[a] + _LOG[b]]
+    return np.where((a == 0) | (b == 0), np.uint8(0), product)
+
+
+def scale(row, c: int):
+    """
+    Multiply every element of a uint8 array by the field constant c.
+    """
+    _require_numpy()
+    return np.take(_PRODUCTS[c], row)
+
+
+def evaluate_rows(
+    rows: Sequence[Row],
+    xs: Sequence[int],
+    length: int,
+) -> List[bytes]:
+    """
+    Evaluate a row polynomial at every x in xs.
+
+    rows[0] is the constant row. Returns one share row per x, each
+    built as a Vandermonde combination of the coefficient rows into a
+    preallocated share matrix.
+    """
+    _require_numpy()
+    coefficients = _as_matrix(rows, length)
+    powers = power_table(len(rows), max(xs, default=0))
+
+    shares = np.zeros((len(xs), length), dtype=np.uint8)
+    scratch = np.empty(length, dtype=np.uint8)
+
+    for i, x in enumerate(xs):
+        acc = shares[i]
+        for row, c in zip(coefficients, powers[x]):
+            if c == 1:
+                acc ^= row
+            elif c != 0:
+                np.take(_PRODUCTS[c], row, out=scratch)
+                acc ^= scratch
+
+    return [shares[i].tobytes() for i in range(len(xs))]
+
+
+def linear_combination(
+    rows: Sequence[Row],
+    coefficients: Sequence[int],
+    length: int,
+) -> bytes:
+    """
+    Compute the XOR of every row scaled by its coefficient.
+
+    All rows must be exactly length bytes long.
+    """
+    _require_numpy()
+    if not rows:
+        return bytes(length)
+
+    matrix = _as_matrix(rows, length)
+    for i, c in enumerate(coefficients):
+        np.take(_PRODUCTS[c], matrix[i], out=matrix[i])
+
+    return np.bitwise_xor.reduce(matrix, axis=0).tobytes()
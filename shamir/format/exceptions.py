@@ -6,9 +6,7 @@ to serialized share formats. They must never originate from the core
 cryptographic layer.
 """
 
-
-class FormatError(Exception):
-    """Base class for all share format errors."""
+from shamir.format.errors import FormatError
 
 
 class UnsupportedFormatVersion(FormatError):
@@ -0,0 +1,130 @@
+"""
+Packed share serialization for shamir-cli.
+
+Packed shares (see shamir.core.packed) carry several secrets on one
+polynomial and cannot be recovered with ordinary Shamir
+interpolation, so they use their own format variant, FORMAT=2P. Its
+version field is not a FORMAT=2 version, so FORMAT=2 parsers reject
+packed shares instead of misreading them.
+
+Layout:
+
+    FORMAT=2P
+    INDEX=<share index>
+    THRESHOLD=<privacy + count>
+    TOTAL=<total shares>
+    PRIVACY=<shares that reveal nothing>
+    COUNT=<secrets packed per share>
+    DATA=<base64 share bytes>
+"""
+
+import base64
+from dataclasses import dataclass
+
+from shamir.format.errors import FormatError
+
+
+FORMAT_VERSION = "2P"
+
+
+@dataclass(frozen=True)
+class PackedShare:
+    index: int
+    threshold: int
+    total: int
+    privacy: int
+    count: int
+    data: bytes
+
+
+def _validate_header(
+    index: int,
+    threshold: int,
+    total: int,
+    privacy: int,
+    count: int,
+) -> None:
+    if index < 1:
+        raise FormatError("share index must be >= 1")
+
+    if privacy < 1:
+        raise FormatError("privacy must be >= 1")
+
+    if count < 1:
+        raise FormatError("count must be >= 1")
+
+    if threshold != privacy + count:
+        raise FormatError("threshold must equal privacy + count")
+
+    if total < threshold:
+        raise FormatError("total must be >= threshold")
+
+    if total + count > 255 or index > total:
+        raise FormatError("share index out of range")
+
+
+def serialize_packed_share(
+    *,
+    index: int,
+    total: int,
+    privacy: int,
+    count: int,
+    data: bytes,
+) -> str:
+    threshold = privacy + count
+    _validate_header(index, threshold, total, privacy, count)
+
+    encoded = base64.b64encode(data).decode("ascii")
+
+    return (
+        f"FORMAT={FORMAT_VERSION}\n"
+        f"INDEX={index}\n"
+        f"THRESHOLD={threshold}\n"
+        f"TOTAL={total}\n"
+        f"PRIVACY={privacy}\n"
+        f"COUNT={count}\n"
+        f"DATA={encoded}\n"
+    )
+
+
+def parse_packed_share(text: str) -> PackedShare:
+    fields = {}
+
+    for line in text.splitlines():
+        if "=" not in line:
+            raise FormatError("invalid line format")
+
+        key, value = line.split("=", 1)
+        fields[key.strip()] = value.strip()
+
+    try:
+        version = fields["FORMAT"]
+        index = int(fields["INDEX"])
+        threshold = int(fields["THRESHOLD"])
+        total = int(fields["TOTAL"])
+        privacy = int(fields["PRIVACY"])
+        count = int(fields["COUNT"])
+        encoded = fields["DATA"]
+    except KeyError as exc:
+        raise FormatError(f"missing field: {exc}") from None
+    except ValueError:
+        raise FormatError("invalid numeric field")
+
+    if version != FORMAT_VERSION:
+        raise FormatError("unsupported format version")
+
+    try:
+        data = base64.b64decode(encoded, validate=True)
+    except Exception:
+        raise FormatError("invalid base64 data")
+
+    _validate_header(index, threshold, total, privacy, count)
+
+    return PackedShare(
+        index=index,
+        threshold=threshold,
+        total=total,
+        privacy=privacy,
+        count=count,
+        data=data,
+    )
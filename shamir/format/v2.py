@@ -4,26 +4,111 @@ Canonical FORMAT=2 share serialization for shamir-cli.
 This module defines the only supported share format as of v0.2.0.
 The format is explicit, versioned, and fail-closed. No auto-detection
 or backward compatibility is permitted.
+
+Shares have two encodings: the KEY=value text form with base64 DATA,
+and the compact binary record of docs/FORMAT.md. Binary records are
+parsed with struct and memoryview slicing, so the payload is never
+copied. text_to_binary and binary_to_text convert between the two.
+
+Text shares written by serialize_share() have a fixed key order,
+which parse_share() and parse_many() match in a single pass.
 """
 
 import base64
+import io
+import os
+import re
+import struct
+import zlib
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, TextIO, Union
 
 from shamir.format.errors import FormatError
+from shamir.format.exceptions import (
+    InconsistentShareParameters,
+    InvalidShareEncoding,
+    InvalidShareMetadata,
+    UnsupportedFormatVersion,
+)
 
 
 FORMAT_VERSION = 2
 
+# Header lines hold small integers; anything longer is malformed.
+_HEADER_LINE_LIMIT = 256
+
+
+_BASE64_ALPHABET = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+)
+
+
+def _check_base64(encoded: bytes) -> None:
+    """
+    Reject DATA that is not strict base64.
+
+    Groups must be complete and padding may only end the data. Only
+    C-level bytes operations are used, so the check costs a fraction
+    of decoding; DATA is decoded later, on first access.
+    """
+    padding = encoded.translate(None, _BASE64_ALPHABET)
+    if (
+        len(encoded) % 4
+        or padding not in (b"", b"=", b"==")
+        or encoded.find(b"=") not in (-1, len(encoded) - len(padding))
+    ):
+        raise FormatError("invalid base64 data")
+
 
 @dataclass(frozen=True)
 class Share:
+    """
+    Parsed FORMAT=2 share.
+
+    Parsers keep DATA as its validated base64 text and decode it on
+    first access to data, so shares that are parsed but never used are
+    never decoded.
+    """
+
     index: int
     threshold: int
     total: int
     data: bytes
 
+    @classmethod
+    def _from_encoded(
+        cls, index: int, threshold: int, total: int, encoded: bytes
+    ) -> "Share":
+        """Build a share whose data is decoded from encoded on first access."""
+        share = object.__new__(cls)
+        object.__setattr__(share, "index", index)
+        object.__setattr__(share, "threshold", threshold)
+        object.__setattr__(share, "total", total)
+        object.__setattr__(share, "_encoded", encoded)
+        return share
 
-def serialize_share(*, index: int, threshold: int, total: int, data: bytes) -> str:
+    def __getattr__(self, name):
+        # Only reached while data has not been decoded yet.
+        if name != "data" or "_encoded" not in self.__dict__:
+            raise AttributeError(name)
+
+        try:
+            data = base64.b64decode(self._encoded, validate=True)
+        except Exception:
+            raise FormatError("invalid base64 data") from None
+
+        object.__setattr__(self, "data", data)
+        object.__delattr__(self, "_encoded")
+        return data
+
+    @property
+    def decoded(self) -> bool:
+        """True once data has been decoded."""
+        return "data" in self.__dict__
+
+
+def _validate_header(index: int, threshold: int, total: int) -> None:
     if index < 1:
         raise FormatError("share index must be >= 1")
 
@@ -33,18 +118,308 @@ def serialize_share(*, index: int, threshold: int, total: int, data: bytes) -> s
     if total < threshold:
         raise FormatError("total must be >= threshold")
 
-    encoded = base64.b64encode(data).decode("ascii")
 
+def _header(index: int, threshold: int, total: int) -> str:
     return (
         f"FORMAT={FORMAT_VERSION}\n"
         f"INDEX={index}\n"
         f"THRESHOLD={threshold}\n"
         f"TOTAL={total}\n"
-        f"DATA={encoded}\n"
     )
 
 
+def serialize_share(*, index: int, threshold: int, total: int, data: bytes) -> str:
+    _validate_header(index, threshold, total)
+
+    encoded = base64.b64encode(data).decode("ascii")
+
+    return _header(index, threshold, total) + f"DATA={encoded}\n"
+
+
+class ShareWriter:
+    """
+    Incremental FORMAT=2 serializer.
+
+    The header is written on construction and share data is appended
+    with write() in arbitrarily sized pieces. Output is byte-identical
+    to serialize_share() over the concatenated data once close() has
+    been called.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        *,
+        index: int,
+        threshold: int,
+        total: int,
+    ) -> None:
+        _validate_header(index, threshold, total)
+
+        self._stream = stream
+        self._pending = b""
+        self._closed = False
+
+        stream.write(_header(index, threshold, total) + "DATA=")
+
+    def write(self, data: bytes) -> None:
+        if self._closed:
+            raise FormatError("share writer is closed")
+
+        data = self._pending + bytes(data)
+        # Base64 only emits padding at the very end, so hold back the
+        # bytes that do not fill a complete 3-byte group.
+        cut = len(data) - len(data) % 3
+
+        self._stream.write(base64.b64encode(data[:cut]).decode("ascii"))
+        self._pending = data[cut:]
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._stream.write(base64.b64encode(self._pending).decode("ascii"))
+        self._stream.write("\n")
+        self._pending = b""
+        self._closed = True
+
+
+class ShareReader:
+    """
+    Incremental FORMAT=2 parser.
+
+    The header is parsed and validated on construction; DATA must be
+    the last field. Share data is then decoded on demand with read(),
+    one aligned base64 window at a time, so a share never has to be
+    held in memory as a whole.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        fields = {}
+
+        while True:
+            line = stream.readline(_HEADER_LINE_LIMIT)
+            if not line:
+                raise FormatError("missing field: 'DATA'")
+
+            if line.startswith("DATA="):
+                break
+
+            if "=" not in line or not line.endswith("\n"):
+                raise FormatError("invalid line format")
+
+            key, value = line.split("=", 1)
+            fields[key.strip()] = value.strip()
+
+        try:
+            version = int(fields["FORMAT"])
+            index = int(fields["INDEX"])
+            threshold = int(fields["THRESHOLD"])
+            total = int(fields["TOTAL"])
+        except KeyError as exc:
+            raise FormatError(f"missing field: {exc}") from None
+        except ValueError:
+            raise FormatError("invalid numeric field")
+
+        if version != FORMAT_VERSION:
+            raise FormatError("unsupported format version")
+
+        _validate_header(index, threshold, total)
+
+        self.index = index
+        self.threshold = threshold
+        self.total = total
+
+        self._stream = stream
+        self._encoded = ""
+        self._decoded = b""
+        self._exhausted = False
+        self._padded = False
+
+        self._feed(line[len("DATA="):].lstrip())
+
+    def _feed(self, text: str) -> None:
+        if "\n" in text:
+            text, rest = text.split("\n", 1)
+            if rest.strip() or self._stream.read(1).strip():
+                raise FormatError("unexpected data after DATA field")
+            self._exhausted = True
+
+        self._encoded += text
+
+        if self._exhausted:
+            self._encoded = self._encoded.rstrip()
+
+    def _decode_window(self, wanted: int) -> None:
+        # Keep one character of lookahead so that trailing whitespace
+        # before the final newline never ends up inside a window.
+        while len(self._encoded) <= wanted and not self._exhausted:
+            text = self._stream.read(wanted + 1 - len(self._encoded))
+            if not text:
+                self._exhausted = True
+                self._encoded = self._encoded.rstrip()
+                break
+            self._feed(text)
+
+        window = self._encoded[:wanted]
+        self._encoded = self._encoded[wanted:]
+
+        if not window:
+            return
+
+        if self._padded:
+            raise FormatError("invalid base64 data")
+
+        try:
+            self._decoded += base64.b64decode(window, validate=True)
+        except Exception:
+            raise FormatError("invalid base64 data")
+
+        self._padded = window.endswith("=")
+
+    def read(self, size: int) -> bytes:
+        """
+        Decode and return up to size bytes of share data.
+
+        Returns b"" once DATA has been fully consumed.
+        """
+        if size < 1:
+            raise ValueError("size must be >= 1")
+
+        while len(self._decoded) < size:
+            before = len(self._decoded)
+            # Every 4 base64 characters decode to exactly 3 bytes.
+            self._decode_window(-(-(size - before) // 3) * 4)
+            if len(self._decoded) == before:
+                break
+
+        data = self._decoded[:size]
+        self._decoded = self._decoded[size:]
+        return data
+
+
+_READ_BUFFER_SIZE = 1 << 16
+
+# serialize_share() output: fixed key order, one field per line and
+# numbers without leading zeros. Anything else, such as a zero-padded
+# INDEX=07, is left to the general parser. Only the header is matched;
+# DATA is the rest of the share up to its final newline.
+_NUMBER = rb"(0|[1-9][0-9]{0,2})"
+_CANONICAL_HEADER = re.compile(
+    rb"FORMAT=" + _NUMBER + rb"\nINDEX=" + _NUMBER
+    + rb"\nTHRESHOLD=" + _NUMBER + rb"\nTOTAL=" + _NUMBER + rb"\nDATA="
+)
+
+# Header values are small, so their integer values are looked up.
+_SMALL_INTS = {str(value).encode("ascii"): value for value in range(1000)}
+
+
+def _parse_canonical(raw: Union[bytes, bytearray], size: int) -> Optional[Share]:
+    """
+    Parse raw[:size] if it has exactly the canonical layout.
+
+    The header is matched by a precompiled pattern anchored at fixed
+    key positions, and DATA is sliced out up to the single newline
+    that ends the share. Returns None if the layout is not canonical,
+    so the caller can fall back to the general parser.
+    """
+    match = _CANONICAL_HEADER.match(raw, 0, size)
+    if match is None:
+        return None
+
+    start = match.end()
+    if raw.find(b"\n", start, size) != size - 1:
+        return None
+
+    version, index, threshold, total = match.groups()
+    version = _SMALL_INTS[version]
+    index = _SMALL_INTS[index]
+    threshold = _SMALL_INTS[threshold]
+    total = _SMALL_INTS[total]
+
+    if version != FORMAT_VERSION:
+        raise FormatError("unsupported format version")
+
+    _validate_header(index, threshold, total)
+
+    with memoryview(raw) as view:
+        encoded = bytes(view[start:size - 1])
+
+    _check_base64(encoded)
+
+    return Share._from_encoded(index, threshold, total, encoded)
+
+
 def parse_share(text: str) -> Share:
+    """
+    Parse a text FORMAT=2 share.
+
+    Canonically laid out shares take a single-pass fast path; any other
+    layout is parsed field by field with the same validation.
+    """
+    try:
+        raw = text.encode("ascii")
+    except UnicodeEncodeError:
+        raise FormatError("invalid characters in share") from None
+
+    share = _parse_canonical(raw, len(raw))
+    if share is not None:
+        return share
+
+    return _parse_fields(text)
+
+
+def _read_file(path: Union[str, Path], buffer: bytearray):
+    """
+    Read a whole file with unbuffered readinto() calls.
+
+    Files smaller than buffer are read into it; larger ones get a
+    buffer of their own, so the shared buffer never grows. Returns the
+    buffer that holds the file and the file size.
+    """
+    with io.FileIO(path) as handle:
+        expected = os.fstat(handle.fileno()).st_size
+        # One spare byte shows whether the file ends where fstat() said.
+        target = buffer if expected < len(buffer) else bytearray(expected + 1)
+        size = handle.readinto(target)
+
+        # A full buffer means the file grew: keep reading into a copy.
+        while size == len(target):
+            target = target + bytes(len(target))
+            with memoryview(target) as view:
+                size += handle.readinto(view[size:])
+
+    return target, size
+
+
+def parse_many(paths: Iterable[Union[str, Path]]) -> List[Share]:
+    """
+    Parse many text FORMAT=2 share files.
+
+    Files up to _READ_BUFFER_SIZE are read into one reusable buffer,
+    so parsing a vault of small shares does not allocate a new file
+    buffer per share; larger files are read into a buffer of their own.
+    """
+    buffer = bytearray(_READ_BUFFER_SIZE)
+    shares = []
+
+    for path in paths:
+        raw, size = _read_file(path, buffer)
+
+        share = _parse_canonical(raw, size)
+        if share is None:
+            try:
+                text = raw[:size].decode("ascii")
+            except UnicodeDecodeError:
+                raise FormatError("invalid characters in share") from None
+            share = _parse_fields(text)
+
+        shares.append(share)
+
+    return shares
+
+
+def _parse_fields(text: str) -> Share:
     fields = {}
 
     for line in text.splitlines():
@@ -59,13 +434,15 @@ def parse_share(text: str) -> Share:
         index = int(fields["INDEX"])
         threshold = int(fields["THRESHOLD"])
         total = int(fields["TOTAL"])
-        data = base64.b64decode(fields["DATA"], validate=True)
+        encoded = fields["DATA"].encode("ascii")
     except KeyError as exc:
         raise FormatError(f"missing field: {exc}") from None
+    except UnicodeEncodeError:
+        raise FormatError("invalid characters in share") from None
     except ValueError:
         raise FormatError("invalid numeric field")
-    except Exception:
-        raise FormatError("invalid base64 data")
+
+    _check_base64(encoded)
 
     if version != FORMAT_VERSION:
         raise FormatError("unsupported format version")
@@ -79,9 +456,118 @@ def parse_share(text: str) -> Share:
     if total < threshold:
         raise FormatError("total must be >= threshold")
 
-    return Share(
+    return Share._from_encoded(index, threshold, total, encoded)
+
+
+# Binary record: version, index, threshold, total, payload length,
+# payload, CRC-32 of everything before it. All fields big-endian.
+_RECORD_HEADER = struct.Struct(">BBBBI")
+_RECORD_CHECKSUM = struct.Struct(">I")
+
+
+@dataclass(frozen=True)
+class ShareRecord:
+    """
+    Decoded binary share; payload is a zero-copy view of the record.
+    """
+
+    version: int
+    index: int
+    threshold: int
+    total: int
+    payload: memoryview
+
+
+def _validate_record(index: int, threshold: int, total: int) -> None:
+    if not 1 <= index <= 255:
+        raise InvalidShareMetadata("share index must be in 1..255")
+
+    if threshold < 2:
+        raise InvalidShareMetadata("threshold must be >= 2")
+
+    if total > 255:
+        raise InvalidShareMetadata("total must be <= 255")
+
+    if threshold > total:
+        raise InconsistentShareParameters("threshold must be <= total")
+
+
+def encode_share(
+    index: int,
+    threshold: int,
+    total: int,
+    payload: bytes,
+) -> bytes:
+    """
+    Encode a share as a binary FORMAT=2 record.
+    """
+    _validate_record(index, threshold, total)
+
+    if not payload:
+        raise InvalidShareEncoding("payload must not be empty")
+
+    record = (
+        _RECORD_HEADER.pack(FORMAT_VERSION, index, threshold, total, len(payload))
+        + bytes(payload)
+    )
+
+    return record + _RECORD_CHECKSUM.pack(zlib.crc32(record))
+
+
+def decode_share(record: Union[bytes, bytearray, memoryview]) -> ShareRecord:
+    """
+    Decode a binary FORMAT=2 record without copying the payload.
+    """
+    view = memoryview(record)
+
+    if len(view) < _RECORD_HEADER.size + _RECORD_CHECKSUM.size:
+        raise InvalidShareEncoding("truncated share record")
+
+    version, index, threshold, total, length = _RECORD_HEADER.unpack_from(view)
+
+    if version != FORMAT_VERSION:
+        raise UnsupportedFormatVersion("unsupported format version")
+
+    end = _RECORD_HEADER.size + length
+    if len(view) != end + _RECORD_CHECKSUM.size:
+        raise InvalidShareEncoding("share record length mismatch")
+
+    (checksum,) = _RECORD_CHECKSUM.unpack_from(view, end)
+    if zlib.crc32(view[:end]) != checksum:
+        raise InvalidShareEncoding("share record checksum mismatch")
+
+    if length == 0:
+        raise InvalidShareEncoding("payload must not be empty")
+
+    _validate_record(index, threshold, total)
+
+    return ShareRecord(
+        version=version,
         index=index,
         threshold=threshold,
         total=total,
-        data=data,
+        payload=view[_RECORD_HEADER.size:end],
+    )
+
+
+def text_to_binary(text: str) -> bytes:
+    """
+    Convert a text FORMAT=2 share into a binary record.
+    """
+    share = parse_share(text)
+
+    return encode_share(share.index, share.threshold, share.total, share.data)
+
+
+def binary_to_text(record: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    Convert a binary FORMAT=2 record into a text share.
+    """
+    share = decode_share(record)
+
+    return serialize_share(
+        index=share.index,
+        threshold=share.threshold,
+        total=share.total,
+        data=bytes(share.payload),
     )
@@ -0,0 +1,174 @@
+"""
+Short-share hybrid mode for Shamir Secret Sharing.
+
+Implements "secret sharing made short" (Krawczyk, 1993): the secret
+is encrypted once under a fresh random data key, and only that key is
+split with Shamir Secret Sharing. The ciphertext is stored once as a
+separate blob, and every share references it by digest.
+
+Share payload format:
+    KEY_SHARE (32 bytes) || SHA-256(CIPHERTEXT_BLOB) (32 bytes)
+
+Ciphertext blob format:
+    NONCE || CIPHERTEXT
+
+Share size is constant regardless of secret size, and the cost of
+splitting no longer grows with the number of shares times the
+secret length.
+
+Dispersal mode additionally spreads the ciphertext blob over the
+shares with Rabin's information dispersal algorithm, so no separate
+blob is stored:
+    KEY_SHARE || SHA-256(CIPHERTEXT_BLOB) || FRAGMENT
+
+Each fragment is |blob| / threshold bytes, and any threshold shares
+reconstruct both the data key and the blob.
+
+Key shares use randomized polynomial coefficients; the data key must
+never be split with deterministic coefficients.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from shamir.core.ida import disperse, reconstruct
+from shamir.core.shamir import split as random_split
+from shamir.core.shamir import recover as random_recover
+from shamir.crypto.aead import AEAD, KEY_SIZE, NONCE_SIZE
+
+
+# ---------------------------------------------------------------------------
+# Parameters (explicit, fixed)
+# ---------------------------------------------------------------------------
+
+DIGEST_LEN = 32       # SHA-256
+SHARE_LEN = KEY_SIZE + DIGEST_LEN
+
+
+@dataclass(frozen=True)
+class ShortShares:
+    """Ciphertext blob stored once plus constant-size key shares."""
+
+    ciphertext: bytes
+    shares: List[Tuple[int, bytes]]
+
+
+def blob_digest(ciphertext: bytes) -> bytes:
+    """
+    Digest used by shares to reference a ciphertext blob.
+    """
+    return hashlib.sha256(ciphertext).digest()
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def split_short(
+    secret: bytes,
+    threshold: int,
+    total: int,
+    associated_data: Optional[bytes] = None,
+) -> ShortShares:
+    """
+    Encrypt a secret under a random data key and split only the key.
+
+    Returns the ciphertext blob and one 64-byte share per index.
+    """
+    if not secret:
+        raise ValueError("Secret must not be empty")
+
+    key = os.urandom(KEY_SIZE)
+    nonce = os.urandom(NONCE_SIZE)
+
+    ciphertext = nonce + AEAD(key).encrypt(nonce, secret, associated_data or b"")
+    digest = blob_digest(ciphertext)
+
+    shares = [
+        (index, key_share + digest)
+        for index, key_share in random_split(key, threshold, total)
+    ]
+
+    return ShortShares(ciphertext=ciphertext, shares=shares)
+
+
+def recover_short(
+    shares: List[Tuple[int, bytes]],
+    ciphertext: bytes,
+    associated_data: Optional[bytes] = None,
+) -> bytes:
+    """
+    Recover the data key from shares and decrypt the ciphertext blob.
+
+    Every share must reference the given ciphertext blob.
+    """
+    if not shares:
+        raise ValueError("No shares provided")
+
+    if len(ciphertext) < NONCE_SIZE:
+        raise ValueError("Invalid ciphertext blob")
+
+    digest = blob_digest(ciphertext)
+    key_shares = []
+
+    for index, data in shares:
+        if len(data) != SHARE_LEN:
+            raise ValueError("Invalid short share length")
+        if data[KEY_SIZE:] != digest:
+            raise ValueError("Share does not reference this ciphertext")
+        key_shares.append((index, data[:KEY_SIZE]))
+
+    key = random_recover(key_shares)
+
+    nonce = ciphertext[:NONCE_SIZE]
+    return AEAD(key).decrypt(nonce, ciphertext[NONCE_SIZE:], associated_data or b"")
+
+
+def split_dispersed(
+    secret: bytes,
+    threshold: int,
+    total: int,
+    associated_data: Optional[bytes] = None,
+) -> List[Tuple[int, bytes]]:
+    """
+    Encrypt a secret, split the data key and disperse the ciphertext.
+
+    Every share carries its key share, the blob digest and one
+    dispersal fragment of roughly |ciphertext| / threshold bytes.
+    """
+    short = split_short(secret, threshold, total, associated_data)
+    fragments = disperse(short.ciphertext, threshold, total)
+
+    return [
+        (index, key_share + fragment)
+        for (index, key_share), (_, fragment) in zip(short.shares, fragments)
+    ]
+
+
+def recover_dispersed(
+    shares: List[Tuple[int, bytes]],
+    threshold: int,
+    associated_data: Optional[bytes] = None,
+) -> bytes:
+    """
+    Reconstruct the ciphertext blob from fragments and decrypt it.
+
+    Requires at least threshold shares from the same split.
+    """
+    if len(shares) < threshold:
+        raise ValueError("Insufficient number of shares")
+
+    short_shares = []
+    fragments = []
+
+    for index, data in shares:
+        if len(data) <= SHARE_LEN:
+            raise ValueError("Invalid dispersed share length")
+        short_shares.append((index, data[:SHARE_LEN]))
+        fragments.append((index, data[SHARE_LEN:]))
+
+    ciphertext = reconstruct(fragments, threshold)
+
+    return recover_short(short_shares, ciphertext, associated_data)
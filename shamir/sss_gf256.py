@@ -5,29 +5,48 @@ This module implements byte-wise Shamir Secret Sharing using
 GF(2^8) arithmetic. Each byte of the secret is treated as an
 independent polynomial evaluated at distinct x coordinates.
 
+Polynomials are processed as whole rows: coefficient a_j of every
+byte position is stored as one row, and share rows are produced with
+the multiply-by-constant kernels from shamir.core.kernels. Recovery
+computes the Lagrange weights at x = 0 once per index set and XORs
+the weight-scaled share rows together.
+
 No authentication, formatting, or I/O is performed here.
 """
 
-from typing import List, Tuple
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import BinaryIO, List, Optional, Sequence, Tuple
 
 from shamir.gf256 import gf_add, gf_mul, gf_inv
+from shamir.core.engine import evaluate_rows, linear_combination
+from shamir.core.resharing import subshare
+from shamir.core.shamir import (
+    refresh_shares,
+    repair_shares,
+    select_for_recovery,
+)
 
 
-def _eval_polynomial(coeffs: List[int], x: int) -> int:
-    """
-    Evaluate a polynomial at x using Horner's method.
-    """
-    result = 0
-    for coeff in reversed(coeffs):
-        result = gf_mul(result, x)
-        result = gf_add(result, coeff)
-    return result
+DEFAULT_CHUNK_SIZE = 1 << 16
 
 
-def split(secret: bytes, threshold: int, shares: int) -> List[Tuple[int, bytes]]:
+def split(
+    secret: bytes,
+    threshold: int,
+    shares: int,
+    *,
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+) -> List[Tuple[int, bytes]]:
     """
     Split a secret into Shamir shares over GF(256).
 
+    With workers > 1 byte positions are processed in parallel worker
+    processes; the result is identical to the serial path.
+
     Returns a list of (index, share_bytes).
     """
     if threshold < 2:
@@ -39,25 +58,113 @@ def split(secret: bytes, threshold: int, shares: int) -> List[Tuple[int, bytes]]
     # Deterministic x coordinates: 1..shares
     x_coords = list(range(1, shares + 1))
 
-    # Prepare empty share buffers
-    share_buffers = {x: bytearray() for x in x_coords}
+    secret_len = len(secret)
 
-    for secret_byte in secret:
-        # Polynomial coefficients: a0 = secret byte, rest zero (deterministic)
-        coeffs = [secret_byte] + [0] * (threshold - 1)
+    # Polynomial coefficient rows: a0 = secret, rest zero (deterministic)
+    rows = [bytes(secret)] + [bytes(secret_len)] * (threshold - 1)
 
-        for x in x_coords:
-            y = _eval_polynomial(coeffs, x)
-            share_buffers[x].append(y)
+    data = evaluate_rows(
+        rows,
+        x_coords,
+        secret_len,
+        workers=workers,
+        executor=executor,
+    )
 
-    return [(x, bytes(share_buffers[x])) for x in x_coords]
+    return list(zip(x_coords, data))
 
 
-def recover(shares: List[Tuple[int, bytes]]) -> bytes:
+def split_stream(
+    reader: BinaryIO,
+    writers: Sequence[BinaryIO],
+    threshold: int,
+    total: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    workers: int = 1,
+) -> int:
+    """
+    Split a stream into Shamir shares over GF(256), chunk by chunk.
+
+    Reads fixed-size chunks from reader and appends each chunk's share
+    rows to writers, where writers[i] receives share index i + 1.
+    Any object with a write(bytes) method may serve as a writer.
+    Unlike split(), the coefficients above a0 are drawn uniformly at
+    random for every chunk, so no single share reveals the input;
+    recover() and recover_stream() reconstruct it unchanged. With
+    workers > 1 one process pool is shared by all chunks, and each step
+    reads chunk_size bytes per worker so that every worker gets a full
+    chunk. Memory use is bounded by chunk_size * workers * total.
+
+    Returns the number of secret bytes consumed.
+    """
+    if threshold < 2:
+        raise ValueError("Threshold must be >= 2")
+
+    if total < threshold:
+        raise ValueError("Total shares must be >= threshold")
+
+    if len(writers) != total:
+        raise ValueError("Expected one writer per share")
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be >= 1")
+
+    x_coords = list(range(1, total + 1))
+    consumed = 0
+
+    with ExitStack() as stack:
+        executor = None
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(workers))
+
+        step = chunk_size * max(workers, 1)
+
+        while True:
+            chunk = reader.read(step)
+            if not chunk:
+                break
+
+            length = len(chunk)
+            pool = memoryview(os.urandom(length * (threshold - 1)))
+            rows = [chunk] + [
+                pool[i * length:(i + 1) * length] for i in range(threshold - 1)
+            ]
+
+            shares = evaluate_rows(
+                rows,
+                x_coords,
+                length,
+                workers=workers,
+                executor=executor,
+            )
+            for writer, data in zip(writers, shares):
+                writer.write(data)
+
+            consumed += len(chunk)
+
+    return consumed
+
+
+def recover(
+    shares: List[Tuple[int, bytes]],
+    *,
+    threshold: Optional[int] = None,
+    policy: Optional[str] = None,
+    indices: Optional[Sequence[int]] = None,
+    check: bool = False,
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+) -> bytes:
     """
     Recover a secret from Shamir shares over GF(256).
 
-    Expects a list of (index, share_bytes).
+    Expects a list of (index, share_bytes). Without threshold every
+    share is interpolated. With threshold exactly threshold shares are
+    chosen by policy ("first", "lowest" or "explicit" with indices,
+    see shamir.core.shamir.select_for_recovery); with check=True the
+    unused shares must agree with the chosen ones. With workers > 1
+    byte positions are processed in parallel worker processes.
     """
     if not shares:
         raise ValueError("No shares provided")
@@ -68,41 +175,240 @@ def recover(shares: List[Tuple[int, bytes]]) -> bytes:
         raise ValueError("Inconsistent share lengths")
 
     secret_len = lengths.pop()
-    secret = bytearray()
 
-    for byte_index in range(secret_len):
-        x_values = []
-        y_values = []
+    shares = select_for_recovery(shares, threshold, policy, indices, check)
+
+    ordered = sorted(shares, key=lambda share: share[0])
+    weights = _lagrange_weights(tuple(x for x, _ in ordered))
 
-        for x, data in shares:
-            x_values.append(x)
-            y_values.append(data[byte_index])
+    return linear_combination(
+        [bytes(data) for _, data in ordered],
+        weights,
+        secret_len,
+        workers=workers,
+        executor=executor,
+    )
 
-        secret_byte = _lagrange_interpolate(0, x_values, y_values)
-        secret.append(secret_byte)
 
-    return bytes(secret)
+def recover_stream(
+    readers: Sequence[Tuple[int, BinaryIO]],
+    writer: BinaryIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    workers: int = 1,
+) -> int:
+    """
+    Recover a secret from streamed Shamir shares over GF(256).
 
+    Expects a list of (index, reader) pairs. Reads chunk_size bytes
+    from every reader in lockstep, interpolates each window and writes
+    the recovered bytes to writer as soon as they are available. With
+    workers > 1 one process pool is shared by all windows, and each
+    window holds chunk_size bytes per worker.
 
-def _lagrange_interpolate(x: int, xs: List[int], ys: List[int]) -> int:
+    Returns the number of secret bytes written.
     """
-    Lagrange interpolation at point x over GF(256).
+    if not readers:
+        raise ValueError("No shares provided")
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be >= 1")
+
+    written = 0
+
+    with ExitStack() as stack:
+        executor = None
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(workers))
+
+        step = chunk_size * max(workers, 1)
+
+        while True:
+            window = [(x, reader.read(step)) for x, reader in readers]
+
+            lengths = {len(data) for _, data in window}
+            if len(lengths) != 1:
+                raise ValueError("Inconsistent share lengths")
+
+            if not lengths.pop():
+                break
+
+            chunk = recover(window, workers=workers, executor=executor)
+            writer.write(chunk)
+            written += len(chunk)
+
+    return written
+
+
+def repair_stream(
+    readers: Sequence[Tuple[int, BinaryIO]],
+    writers: Sequence[Tuple[int, BinaryIO]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    threshold: Optional[int] = None,
+    total: Optional[int] = None,
+) -> int:
+    """
+    Regenerate missing shares from streamed Shamir shares over GF(256).
+
+    Expects threshold (index, reader) pairs and one (index, writer)
+    pair per share to regenerate. Reads chunk_size bytes from every
+    reader in lockstep and writes the regenerated share bytes at each
+    writer's index; the secret is never reconstructed. If threshold is
+    given, fewer readers are rejected; if total is given, every writer
+    index must lie in 1..total.
+
+    Returns the number of bytes written to each writer.
+    """
+    if not readers:
+        raise ValueError("No shares provided")
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be >= 1")
+
+    if threshold is not None and len(readers) < threshold:
+        raise ValueError("Insufficient number of shares")
+
+    targets = [x for x, _ in writers]
+    if total is not None:
+        for x in targets:
+            if not 1 <= x <= total:
+                raise ValueError(f"Share index must be in 1..{total}")
+
+    written = 0
+
+    while True:
+        window = [(x, reader.read(chunk_size)) for x, reader in readers]
+
+        lengths = {len(data) for _, data in window}
+        if len(lengths) != 1:
+            raise ValueError("Inconsistent share lengths")
+
+        if not lengths.pop():
+            break
+
+        repaired = repair_shares(
+            window, targets, threshold=threshold, total=total
+        )
+        for (_, writer), (_, data) in zip(writers, repaired):
+            writer.write(data)
+
+        written += len(window[0][1])
+
+    return written
+
+
+def refresh_stream(
+    readers: Sequence[Tuple[int, BinaryIO]],
+    writers: Sequence[BinaryIO],
+    threshold: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Re-randomize streamed Shamir shares over GF(256).
+
+    Expects every (index, reader) pair of one secret and one writer per
+    reader. Reads chunk_size bytes from every reader in lockstep, adds
+    shares of a fresh zero-constant polynomial and writes the refreshed
+    bytes; the secret is never reconstructed.
+
+    Returns the number of bytes written to each writer.
+    """
+    if not readers:
+        raise ValueError("No shares provided")
+
+    if len(writers) != len(readers):
+        raise ValueError("Writer count must match reader count")
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be >= 1")
+
+    written = 0
+
+    while True:
+        window = [(x, reader.read(chunk_size)) for x, reader in readers]
+
+        lengths = {len(data) for _, data in window}
+        if len(lengths) != 1:
+            raise ValueError("Inconsistent share lengths")
+
+        if not lengths.pop():
+            break
+
+        refreshed = refresh_shares(window, threshold)
+        for writer, (_, data) in zip(writers, refreshed):
+            writer.write(data)
+
+        written += len(window[0][1])
+
+    return written
+
+
+def subshare_stream(
+    reader: BinaryIO,
+    writers: Sequence[BinaryIO],
+    new_threshold: int,
+    new_total: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Sub-split one streamed share for threshold re-sharing.
+
+    Reads the share chunk by chunk and writes sub-share j to
+    writers[j - 1] under the (new_threshold, new_total) policy, with
+    random coefficients. A new custodian combines the sub-shares it
+    received from threshold current custodians with recover_stream,
+    passing each current custodian's index.
+
+    Returns the number of share bytes consumed.
+    """
+    if len(writers) != new_total:
+        raise ValueError("Writer count must match total shares")
+
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be >= 1")
+
+    consumed = 0
+
+    while True:
+        chunk = reader.read(chunk_size)
+        if not chunk:
+            break
+
+        subshares = subshare(chunk, new_threshold, new_total)
+        for writer, (_, data) in zip(writers, subshares):
+            writer.write(data)
+
+        consumed += len(chunk)
+
+    return consumed
+
+
+@lru_cache(maxsize=64)
+def _lagrange_weights(xs: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Lagrange basis weights at x = 0 over GF(256).
+
+    The interpolated secret is the XOR of weights[i] * ys[i]. Weights
+    depend only on the x coordinates, so they are cached per sorted
+    index tuple and shared by every byte position and every recovery
+    over the same share set.
     """
-    result = 0
+    weights = []
     k = len(xs)
 
     for i in range(k):
-        xi, yi = xs[i], ys[i]
-        term = yi
+        xi = xs[i]
+        weight = 1
 
         for j in range(k):
             if i == j:
                 continue
             xj = xs[j]
-            numerator = gf_add(x, xj)
+            numerator = xj
             denominator = gf_add(xi, xj)
-            term = gf_mul(term, gf_mul(numerator, gf_inv(denominator)))
+            weight = gf_mul(weight, gf_mul(numerator, gf_inv(denominator)))
 
-        result = gf_add(result, term)
+        weights.append(weight)
 
-    return result
+    return tuple(weights)
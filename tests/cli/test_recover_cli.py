@@ -113,3 +113,127 @@ def test_recover_fails_when_output_exists(tmp_path):
 
     assert result.returncode != 0
     assert "exists" in result.stderr.lower()
+
+
+def test_recover_check_rejects_inconsistent_unused_share(tmp_path):
+    from shamir.format.v2 import parse_share, serialize_share
+
+    _, shares_dir = _run_split(tmp_path)
+    output_file = tmp_path / "recovered.bin"
+
+    path = shares_dir / "share-3.txt"
+    share = parse_share(path.read_text(encoding="utf-8"))
+    data = bytearray(share.data)
+    data[0] ^= 0x01
+    path.write_text(
+        serialize_share(
+            index=share.index,
+            threshold=share.threshold,
+            total=share.total,
+            data=bytes(data),
+        ),
+        encoding="utf-8",
+    )
+
+    result = subprocess.run(
+        [
+            "python",
+            "-m",
+            "shamir.cli.main",
+            "recover",
+            "--input-dir",
+            str(shares_dir),
+            "--output",
+            str(output_file),
+            "--check",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "inconsistent shares: 3" in result.stderr
+    assert not output_file.exists()
+
+
+def test_recover_explicit_selection_requires_supplied_indices(tmp_path):
+    _, shares_dir = _run_split(tmp_path)
+    output_file = tmp_path / "recovered.bin"
+
+    result = subprocess.run(
+        [
+            "python",
+            "-m",
+            "shamir.cli.main",
+            "recover",
+            "--input-dir",
+            str(shares_dir),
+            "--output",
+            str(output_file),
+            "--select",
+            "explicit",
+            "--indices",
+            "1",
+            "7",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "not supplied" in result.stderr
+
+
+def test_recover_rejects_indices_without_explicit_selection(tmp_path):
+    _, shares_dir = _run_split(tmp_path)
+    output_file = tmp_path / "recovered.bin"
+
+    result = subprocess.run(
+        [
+            "python",
+            "-m",
+            "shamir.cli.main",
+            "recover",
+            "--input-dir",
+            str(shares_dir),
+            "--output",
+            str(output_file),
+            "--select",
+            "lowest",
+            "--indices",
+            "2",
+            "3",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "--indices requires --select explicit" in result.stderr
+    assert not output_file.exists()
+
+
+def test_recover_indices_imply_explicit_selection(tmp_path):
+    _, shares_dir = _run_split(tmp_path)
+    output_file = tmp_path / "recovered.bin"
+
+    result = subprocess.run(
+        [
+            "python",
+            "-m",
+            "shamir.cli.main",
+            "recover",
+            "--input-dir",
+            str(shares_dir),
+            "--output",
+            str(output_file),
+            "--indices",
+            "1",
+            "7",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "not supplied" in result.stderr
@@ -62,3 +62,78 @@ def test_split_cli_rejects_empty_input():
 
     assert result.returncode != 0
     assert b"input" in result.stderr.lower()
+
+
+def test_split_cli_streams_in_chunks(tmp_path):
+    from shamir.format.v2 import parse_share
+
+    secret_file = tmp_path / "secret.bin"
+    shares_dir = tmp_path / "shares"
+    secret_file.write_bytes(bytes(range(256)) * 40)
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "shamir.cli.main",
+            "split",
+            "--threshold",
+            "2",
+            "--total",
+            "3",
+            "--input",
+            str(secret_file),
+            "--output-dir",
+            str(shares_dir),
+            "--chunk-size",
+            "100",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    assert result.returncode == 0
+
+    shares = [
+        parse_share(path.read_text(encoding="utf-8"))
+        for path in sorted(shares_dir.glob("share-*.txt"))
+    ]
+
+    assert [share.index for share in shares] == [1, 2, 3]
+    assert len({len(share.data) for share in shares}) == 1
+
+
+def test_split_cli_shares_do_not_expose_payload(tmp_path):
+    from shamir.format.v2 import parse_share
+
+    secret_file = tmp_path / "secret.bin"
+    shares_dir = tmp_path / "shares"
+    secret_file.write_bytes(b"cli secret" * 10)
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "shamir.cli.main",
+            "split",
+            "--threshold",
+            "2",
+            "--total",
+            "3",
+            "--input",
+            str(secret_file),
+            "--output-dir",
+            str(shares_dir),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert result.returncode == 0
+
+    first, second, third = (
+        parse_share((shares_dir / f"share-{i}.txt").read_text("utf-8")).data
+        for i in (1, 2, 3)
+    )
+
+    assert len({first, second, third}) == 3
+    assert secret_file.read_bytes() not in (first, second, third)
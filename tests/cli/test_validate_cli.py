@@ -0,0 +1,78 @@
+import subprocess
+import sys
+
+from shamir.format.v2 import parse_share, serialize_share
+
+
+def run_validate(input_dir):
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "shamir.cli.main",
+            "validate",
+            "--input-dir",
+            str(input_dir),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+
+def split_to(tmp_path, threshold, total):
+    secret_file = tmp_path / "secret.bin"
+    shares_dir = tmp_path / "shares"
+    secret_file.write_bytes(b"validate me" * 20)
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "shamir.cli.main",
+            "split",
+            "--threshold",
+            str(threshold),
+            "--total",
+            str(total),
+            "--input",
+            str(secret_file),
+            "--output-dir",
+            str(shares_dir),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert result.returncode == 0
+    return shares_dir
+
+
+def test_validate_accepts_split_output(tmp_path):
+    shares_dir = split_to(tmp_path, 2, 4)
+
+    result = run_validate(shares_dir)
+
+    assert result.returncode == 0
+    assert result.stderr == b""
+
+
+def test_validate_reports_inconsistent_share(tmp_path):
+    shares_dir = split_to(tmp_path, 2, 4)
+
+    path = shares_dir / "share-4.txt"
+    share = parse_share(path.read_text(encoding="utf-8"))
+    data = bytearray(share.data)
+    data[-1] ^= 0x01
+    path.write_text(
+        serialize_share(
+            index=share.index,
+            threshold=share.threshold,
+            total=share.total,
+            data=bytes(data),
+        ),
+        encoding="utf-8",
+    )
+
+    result = run_validate(shares_dir)
+
+    assert result.returncode != 0
+    assert b"inconsistent shares: 4" in result.stderr
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from shamir.core.collector import QuorumCollector
+from shamir.core.shamir import split
+
+
+def test_secret_available_after_threshold_shares():
+    secret = os.urandom(500)
+    shares = split(secret, 3, 5)
+    collector = QuorumCollector(3)
+
+    for index, data in shares[1:4]:
+        assert not collector.complete
+        collector.add(index, data)
+
+    assert collector.complete
+    assert collector.secret() == secret
+
+
+def test_secret_requires_threshold_shares():
+    shares = split(b"secret", 3, 5)
+    collector = QuorumCollector(3)
+    collector.add(*shares[0])
+    collector.add(*shares[1])
+
+    with pytest.raises(ValueError):
+        collector.secret()
+
+
+def test_surplus_shares_are_checked_for_consistency():
+    secret = os.urandom(64)
+    shares = split(secret, 2, 4)
+    collector = QuorumCollector(2)
+
+    for index, data in shares[:3]:
+        collector.add(index, data)
+    assert collector.consistent
+
+    collector.add(4, os.urandom(64))
+    assert not collector.consistent
+    assert collector.secret() == secret
+
+
+@pytest.mark.parametrize("bad_position", [0, 1, 2, 3])
+def test_remove_invalid_share(bad_position):
+    secret = os.urandom(100)
+    shares = split(secret, 3, 5)
+    arrivals = shares[:3]
+    arrivals.insert(bad_position, (5, os.urandom(100)))
+
+    collector = QuorumCollector(3)
+    for index, data in arrivals:
+        collector.add(index, data)
+
+    collector.remove(5)
+
+    assert collector.indices == [1, 2, 3]
+    assert collector.consistent
+    assert collector.secret() == secret
+
+
+def test_add_rejects_invalid_shares():
+    collector = QuorumCollector(2)
+    collector.add(1, b"ab")
+
+    with pytest.raises(ValueError):
+        collector.add(1, b"cd")
+
+    with pytest.raises(ValueError):
+        collector.add(2, b"c")
+
+    with pytest.raises(ValueError):
+        collector.add(0, b"cd")
+
+    with pytest.raises(ValueError):
+        collector.remove(3)
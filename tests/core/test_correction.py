@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from shamir.core.correction import (
+    berlekamp_welch,
+    check_consistency,
+    recover_with_errors,
+)
+from shamir.core.exceptions import InterpolationError
+from shamir.core.polynomial import evaluate
+from shamir.core.shamir import split
+
+
+def _corrupt(shares, indices, position=None):
+    corrupted = []
+    for index, data in shares:
+        if index in indices:
+            data = bytearray(data)
+            for i in range(len(data)) if position is None else [position]:
+                data[i] ^= 0x5A
+            data = bytes(data)
+        corrupted.append((index, data))
+    return corrupted
+
+
+def test_berlekamp_welch_locates_bad_points():
+    coefficients = [42, 7, 99]
+    points = [(x, evaluate(coefficients, x)) for x in range(1, 8)]
+    points[1] = (points[1][0], points[1][1] ^ 1)
+    points[5] = (points[5][0], points[5][1] ^ 0xFF)
+
+    decoded, bad = berlekamp_welch(points, threshold=3)
+
+    assert decoded == coefficients
+    assert bad == [2, 6]
+
+
+def test_recover_without_errors():
+    secret = os.urandom(64)
+    shares = split(secret, 3, 7)
+
+    assert recover_with_errors(shares, 3) == (secret, [])
+
+
+@pytest.mark.parametrize("bad", [[1], [4], [1, 2], [3, 7], [6, 7]])
+def test_recover_excludes_corrupted_shares(bad):
+    secret = os.urandom(100)
+    shares = _corrupt(split(secret, 3, 7), bad)
+
+    assert recover_with_errors(shares, 3) == (secret, bad)
+
+
+def test_recover_locates_errors_in_different_positions():
+    secret = os.urandom(100)
+    shares = split(secret, 3, 7)
+    shares = _corrupt(shares, [2], position=10)
+    shares = _corrupt(shares, [5], position=90)
+
+    assert recover_with_errors(shares, 3) == (secret, [2, 5])
+
+
+def test_recover_fails_with_too_many_errors():
+    secret = os.urandom(32)
+    shares = _corrupt(split(secret, 3, 7), [1, 2, 3])
+
+    with pytest.raises(InterpolationError):
+        recover_with_errors(shares, 3)
+
+
+def test_recover_detects_error_without_redundancy_to_correct():
+    shares = _corrupt(split(b"secret", 3, 4), [2])
+
+    with pytest.raises(InterpolationError):
+        recover_with_errors(shares, 3)
+
+
+def test_recover_requires_threshold_shares():
+    shares = split(b"secret", 3, 5)
+
+    with pytest.raises(ValueError):
+        recover_with_errors(shares[:2], 3)
+
+
+def test_check_consistency_accepts_agreeing_shares():
+    shares = split(os.urandom(50), 3, 6)
+
+    assert check_consistency(shares, 3) == []
+    assert check_consistency(shares[:3], 3) == []
+
+
+def test_check_consistency_reports_surplus_mismatches():
+    shares = _corrupt(split(os.urandom(50), 3, 6), [4, 6], position=49)
+
+    assert check_consistency(shares, 3) == [4, 6]
+
+
+def test_check_consistency_flags_all_surplus_when_base_is_corrupt():
+    shares = _corrupt(split(os.urandom(50), 3, 6), [1], position=0)
+
+    assert check_consistency(shares, 3) == [4, 5, 6]
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from shamir.core import engine, kernels, shamir
+
+
+def test_partition_covers_all_columns():
+    for length in (1, 7, 100, 1001):
+        for parts in (1, 2, 3, 8):
+            ranges = engine._partition(length, parts)
+            assert len(ranges) <= parts
+            assert ranges[0][0] == 0
+            assert ranges[-1][1] == length
+            for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                assert end == start
+
+
+def test_parallel_evaluate_rows_matches_serial():
+    rows = [os.urandom(1000) for _ in range(3)]
+    xs = [1, 2, 3, 4, 5]
+    assert engine.evaluate_rows(
+        rows, xs, 1000, backend="python", workers=3
+    ) == kernels.evaluate_rows(rows, xs, 1000)
+
+
+def test_parallel_linear_combination_matches_serial():
+    rows = [os.urandom(1000) for _ in range(3)]
+    weights = [3, 0x53, 0xCA]
+    assert engine.linear_combination(
+        rows, weights, 1000, backend="python", workers=3
+    ) == kernels.linear_combination(rows, weights, 1000)
+
+
+def test_parallel_split_is_byte_identical(monkeypatch):
+    secret = os.urandom(5000)
+    pool = os.urandom(len(secret) * 2)
+
+    def fixed_rows(length, count):
+        view = memoryview(pool)
+        return [view[i * length:(i + 1) * length] for i in range(count)]
+
+    monkeypatch.setattr(shamir, "_coefficient_rows", fixed_rows)
+
+    serial = shamir.split(secret, threshold=3, total=5)
+    parallel = shamir.split(secret, threshold=3, total=5, workers=4)
+
+    assert parallel == serial
+    assert shamir.recover(parallel[1:4], workers=4) == secret
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        engine.row_backend("gpu")
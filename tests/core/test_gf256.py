@@ -1,6 +1,6 @@
 import pytest
 
-from shamir.core.gf256 import add, sub, mul, inv
+from shamir.core.gf256 import add, sub, mul, inv, get_backend
 
 
 def test_addition_is_xor():
@@ -42,3 +42,31 @@ def test_inverse_property():
 def test_inverse_of_zero_raises():
     with pytest.raises(ZeroDivisionError):
         inv(0)
+
+
+def test_table_backend_matches_reference():
+    table = get_backend("table")
+    reference = get_backend("reference")
+    for a in range(256):
+        for b in range(256):
+            assert table.mul(a, b) == reference.mul(a, b)
+
+
+def test_table_inverse_matches_reference():
+    table = get_backend("table")
+    reference = get_backend("reference")
+    for a in range(1, 256):
+        assert table.inv(a) == reference.inv(a)
+
+
+def test_table_pow_matches_reference():
+    table = get_backend("table")
+    reference = get_backend("reference")
+    for a in range(256):
+        for exponent in (0, 1, 2, 3, 7, 254, 255, 300):
+            assert table.pow(a, exponent) == reference.pow(a, exponent)
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        get_backend("unknown")
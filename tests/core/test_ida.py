@@ -0,0 +1,44 @@
+import itertools
+import os
+
+import pytest
+
+from shamir.core.ida import disperse, reconstruct
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 100, 1001])
+def test_any_threshold_subset_reconstructs(length):
+    data = os.urandom(length)
+    fragments = disperse(data, threshold=3, total=5)
+
+    for subset in itertools.combinations(fragments, 3):
+        assert reconstruct(list(subset), threshold=3) == data
+
+
+def test_dispersal_is_systematic():
+    data = bytes(range(90))
+    fragments = disperse(data, threshold=3, total=5)
+
+    width = len(fragments[0][1])
+    assert b"".join(fragment for _, fragment in fragments[:3])[:90] == data
+    assert all(len(fragment) == width for _, fragment in fragments)
+    assert width == -(-(len(data) + 1) // 3)
+
+
+def test_reconstruct_requires_threshold_fragments():
+    fragments = disperse(b"dispersed data", threshold=3, total=5)
+
+    with pytest.raises(ValueError):
+        reconstruct(fragments[:2], threshold=3)
+
+
+def test_reconstruct_rejects_duplicate_indices():
+    fragments = disperse(b"dispersed data", threshold=2, total=3)
+
+    with pytest.raises(ValueError):
+        reconstruct([fragments[0], fragments[0]], threshold=2)
+
+
+def test_disperse_rejects_too_many_fragments():
+    with pytest.raises(ValueError):
+        disperse(b"data", threshold=2, total=256)
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from shamir.core.gf256 import add, mul, pow as gf_pow
+from shamir.core.kernels import (
+    scale,
+    xor_into,
+    linear_combination,
+    horner,
+    power_table,
+    evaluate_rows,
+)
+from shamir.core.polynomial import evaluate
+
+
+def test_scale_matches_bytewise_multiplication():
+    buf = bytes(range(256))
+    for c in range(256):
+        assert scale(buf, c) == bytes(mul(c, b) for b in buf)
+
+
+def test_xor_into_matches_bytewise_addition():
+    a = os.urandom(64)
+    b = os.urandom(64)
+    acc = bytearray(a)
+    xor_into(acc, b)
+    assert bytes(acc) == bytes(add(x, y) for x, y in zip(a, b))
+
+
+def test_xor_into_rejects_length_mismatch():
+    with pytest.raises(ValueError):
+        xor_into(bytearray(2), b"\x01")
+
+
+def test_linear_combination_matches_bytewise():
+    rows = [os.urandom(32) for _ in range(4)]
+    coefficients = [0, 1, 0x53, 0xCA]
+    expected = bytearray(32)
+    for row, c in zip(rows, coefficients):
+        for i, b in enumerate(row):
+            expected[i] ^= mul(c, b)
+    assert linear_combination(rows, coefficients, 32) == bytes(expected)
+
+
+def test_horner_matches_evaluate():
+    rows = [os.urandom(16) for _ in range(3)]
+    for x in (1, 2, 7, 255):
+        expected = bytes(
+            evaluate([row[i] for row in rows], x) for i in range(16)
+        )
+        assert horner(rows, x, 16) == expected
+
+
+def test_kernels_accept_empty_rows():
+    assert scale(b"", 7) == b""
+    assert linear_combination([b"", b""], [1, 2], 0) == b""
+    assert horner([b"", b""], 3, 0) == b""
+
+
+def test_power_table_entries():
+    table = power_table(4, 10)
+    assert len(table) == 11
+    for x in range(11):
+        assert table[x] == tuple(gf_pow(x, j) for j in range(4))
+
+
+def test_evaluate_rows_matches_horner():
+    rows = [os.urandom(24) for _ in range(5)]
+    xs = list(range(1, 256))
+    shares = evaluate_rows(rows, xs, 24)
+    for x, share in zip(xs, shares):
+        assert share == horner(rows, x, 24)
+
+
+def test_evaluate_rows_accepts_memoryview_rows():
+    pool = memoryview(os.urandom(48))
+    rows = [pool[:24], pool[24:]]
+    assert evaluate_rows(rows, [3], 24) == [horner(rows, 3, 24)]
@@ -0,0 +1,66 @@
+import itertools
+import os
+
+import pytest
+
+from shamir.core.packed import recover_packed, secret_points, split_packed
+
+
+def test_any_threshold_subset_recovers_all_secrets():
+    secrets = [os.urandom(32) for _ in range(3)]
+    shares = split_packed(secrets, privacy=2, total=7)
+
+    assert [index for index, _ in shares] == list(range(1, 8))
+    for subset in itertools.combinations(shares, 5):
+        assert recover_packed(list(subset), count=3, privacy=2) == secrets
+
+
+def test_share_size_matches_one_secret():
+    secrets = [os.urandom(32) for _ in range(8)]
+    shares = split_packed(secrets, privacy=3, total=12)
+
+    assert all(len(data) == 32 for _, data in shares)
+
+
+def test_privacy_shares_do_not_depend_on_secrets(monkeypatch):
+    pool = os.urandom(64)
+    monkeypatch.setattr(os, "urandom", lambda n: pool[:n])
+
+    first = split_packed([b"a" * 16, b"b" * 16], privacy=2, total=5)
+    second = split_packed([b"c" * 16, b"d" * 16], privacy=2, total=5)
+
+    assert first[:2] == second[:2]
+    assert first[2:] != second[2:]
+
+
+def test_recover_requires_privacy_plus_count_shares():
+    shares = split_packed([b"x" * 8, b"y" * 8], privacy=2, total=5)
+
+    with pytest.raises(ValueError):
+        recover_packed(shares[:3], count=2, privacy=2)
+
+
+def test_recover_rejects_out_of_range_index():
+    shares = split_packed([b"ab", b"cd"], privacy=1, total=4)
+
+    for index in (0, 256, 300):
+        with pytest.raises(ValueError, match="1..255"):
+            recover_packed([(index, shares[0][1])] + shares[1:], 2, 1)
+
+
+def test_split_rejects_invalid_policy():
+    with pytest.raises(ValueError):
+        split_packed([b"ab", b"c"], privacy=1, total=4)
+
+    with pytest.raises(ValueError):
+        split_packed([b"ab"], privacy=0, total=4)
+
+    with pytest.raises(ValueError):
+        split_packed([b"ab"] * 3, privacy=2, total=4)
+
+    with pytest.raises(ValueError):
+        split_packed([b"ab"] * 10, privacy=2, total=250)
+
+
+def test_secret_points_are_outside_share_range():
+    assert secret_points(3) == [255, 254, 253]
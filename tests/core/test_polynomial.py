@@ -1,6 +1,12 @@
 import pytest
 
-from shamir.core.polynomial import evaluate, interpolate
+from shamir.core.polynomial import (
+    barycentric_basis,
+    barycentric_weights,
+    basis_weights,
+    evaluate,
+    interpolate,
+)
 from shamir.core.gf256 import add, mul
 
 
@@ -41,3 +47,11 @@ def test_interpolation_duplicate_x_raises():
     points = [(1, 10), (1, 20)]
     with pytest.raises(ZeroDivisionError):
         interpolate(points, x=0)
+
+
+def test_barycentric_basis_matches_basis_weights():
+    xs = [3, 7, 11, 200]
+    weights = barycentric_weights(xs)
+
+    for x in range(256):
+        assert barycentric_basis(xs, weights, x) == basis_weights(xs, x=x)
@@ -0,0 +1,53 @@
+import itertools
+import os
+
+import pytest
+
+from shamir.core.resharing import combine_subshares, reshare, subshare
+from shamir.core.shamir import recover, split
+
+
+def test_reshare_to_larger_policy():
+    secret = os.urandom(100)
+    shares = split(secret, 3, 5)
+
+    new_shares = reshare(shares[1:4], 4, 7)
+
+    assert [index for index, _ in new_shares] == list(range(1, 8))
+    for subset in itertools.combinations(new_shares, 4):
+        assert recover(list(subset)) == secret
+
+
+def test_reshare_to_smaller_policy():
+    secret = os.urandom(64)
+    shares = split(secret, 4, 6)
+
+    new_shares = reshare(shares[:4], 2, 3)
+
+    for subset in itertools.combinations(new_shares, 2):
+        assert recover(list(subset)) == secret
+
+
+def test_custodian_steps_match_reshare_semantics():
+    secret = os.urandom(40)
+    shares = split(secret, 2, 3)
+    old = [shares[0], shares[2]]
+
+    sent = {index: dict(subshare(data, 3, 4)) for index, data in old}
+    new_shares = [
+        (j, combine_subshares([(index, sent[index][j]) for index, _ in old]))
+        for j in range(1, 5)
+    ]
+
+    assert recover(new_shares[1:]) == secret
+
+
+def test_combine_subshares_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        combine_subshares([])
+
+    with pytest.raises(ValueError):
+        combine_subshares([(1, b"ab"), (1, b"cd")])
+
+    with pytest.raises(ValueError):
+        combine_subshares([(1, b"ab"), (2, b"c")])
@@ -1,6 +1,14 @@
+import os
+
 import pytest
 
-from shamir.core.shamir import split, recover
+from shamir.core.shamir import (
+    split,
+    recover,
+    refresh_shares,
+    repair_shares,
+    select_shares,
+)
 from shamir.core.exceptions import (
     InvalidThreshold,
     InvalidShareCount,
@@ -46,3 +54,336 @@ def test_recover_inconsistent_share_lengths():
 def test_recover_requires_at_least_one_share():
     with pytest.raises(ValueError):
         recover([])
+
+
+def _chi_square(data):
+    counts = [0] * 256
+    for byte in data:
+        counts[byte] += 1
+    expected = len(data) / 256
+    return sum((count - expected) ** 2 / expected for count in counts)
+
+
+def test_coefficient_rows_are_uniform():
+    from shamir.core.shamir import _coefficient_rows
+
+    rows = _coefficient_rows(1 << 14, 4)
+
+    assert len(rows) == 4
+    for row in rows:
+        assert len(row) == 1 << 14
+        # 255 degrees of freedom; 400 is far beyond the 1e-6 tail
+        assert _chi_square(bytes(row)) < 400
+
+    assert len({bytes(row) for row in rows}) == 4
+
+
+def test_share_bytes_of_constant_secret_are_uniform():
+    secret = bytes(1 << 14)
+    shares = split(secret, threshold=3, total=4)
+
+    for _, data in shares:
+        assert _chi_square(data) < 400
+
+
+def test_split_many_roundtrip():
+    from shamir.core.shamir import split_many
+
+    batch_secrets = [os.urandom(32) for _ in range(50)] + [b"x", b"longer secret"]
+    batch = split_many(batch_secrets, threshold=3, total=5)
+
+    assert len(batch) == len(batch_secrets)
+    assert batch.indices == (1, 2, 3, 4, 5)
+
+    for secret, shares in zip(batch_secrets, batch):
+        assert [index for index, _ in shares] == [1, 2, 3, 4, 5]
+        assert recover(shares[2:]) == secret
+
+
+def test_split_many_is_exported_from_core_package():
+    import shamir.core
+    from shamir.core import ShareBatch, split_many
+
+    assert shamir.core.split_many is split_many
+
+    batch = split_many([b"alpha", b"beta"], threshold=2, total=3)
+
+    assert isinstance(batch, ShareBatch)
+    assert recover(batch.shares(0)[:2]) == b"alpha"
+    assert recover(batch.shares(1)[1:]) == b"beta"
+
+
+def test_split_many_authenticated_splits_aead_payloads():
+    from shamir.aead import NONCE_LEN, SALT_LEN
+    from shamir.core import recover_many, split_many
+
+    batch_secrets = [b"k" * 32, b"k" * 32]
+    batch = split_many(
+        batch_secrets,
+        threshold=2,
+        total=3,
+        authenticated=True,
+        associated_data=b"escrow",
+    )
+
+    payloads = recover_many(batch)
+
+    assert len(payloads) == 2
+    assert payloads[0] != payloads[1]
+    for payload in payloads:
+        assert len(payload) == SALT_LEN + NONCE_LEN + 32 + 16
+        assert b"k" * 32 not in payload
+
+
+def test_split_many_draws_randomness_once(monkeypatch):
+    from shamir.core import shamir as shamir_module
+
+    calls = []
+    original = shamir_module._coefficient_rows
+
+    def counting(length, count):
+        calls.append((length, count))
+        return original(length, count)
+
+    monkeypatch.setattr(shamir_module, "_coefficient_rows", counting)
+
+    shamir_module.split_many([b"a" * 32] * 10, threshold=4, total=6)
+
+    assert calls == [(320, 3)]
+
+
+def test_split_many_rejects_invalid_policy():
+    from shamir.core.shamir import split_many
+
+    with pytest.raises(ValueError):
+        split_many([b"secret"], threshold=1, total=3)
+
+
+def test_share_batch_position_out_of_range():
+    from shamir.core.shamir import split_many
+
+    batch = split_many([b"one"], threshold=2, total=2)
+
+    with pytest.raises(IndexError):
+        batch.shares(1)
+
+
+def test_recover_many_groups_by_index_set():
+    from shamir.core.shamir import recover_many
+
+    batch_secrets = [os.urandom(n) for n in (16, 32, 1, 64)]
+    share_sets = [split(secret, threshold=3, total=5) for secret in batch_secrets]
+
+    selections = [
+        share_sets[0][:3],
+        list(reversed(share_sets[1][:3])),
+        share_sets[2][2:],
+        share_sets[3][1:4],
+    ]
+
+    assert recover_many(selections) == batch_secrets
+
+
+def test_recover_many_is_exported_from_core_package():
+    import shamir.core
+    from shamir.core import recover_many, split_many
+
+    assert shamir.core.recover_many is recover_many
+
+    batch = split_many([b"first", b"second"], threshold=2, total=3)
+
+    assert recover_many(batch) == [b"first", b"second"]
+
+
+def test_recover_many_accepts_share_batch():
+    from shamir.core.shamir import recover_many, split_many
+
+    batch_secrets = [os.urandom(32) for _ in range(20)]
+    batch = split_many(batch_secrets, threshold=2, total=3)
+
+    assert recover_many(batch) == batch_secrets
+    assert recover_many(
+        [shares[1:] for shares in batch]
+    ) == batch_secrets
+
+
+def test_recover_many_rejects_inconsistent_lengths():
+    from shamir.core.shamir import recover_many
+
+    with pytest.raises(ValueError):
+        recover_many([[(1, b"\x01\x02"), (2, b"\x01")]])
+
+
+def test_repair_shares_regenerates_missing_indices():
+    secret = os.urandom(300)
+    shares = split(secret, 3, 6)
+
+    repaired = repair_shares([shares[1], shares[3], shares[5]], [1, 3, 5])
+
+    assert repaired == [shares[0], shares[2], shares[4]]
+    assert recover(repaired) == secret
+
+
+def test_repair_shares_rejects_present_or_invalid_index():
+    shares = split(b"secret", 2, 3)
+
+    with pytest.raises(ValueError):
+        repair_shares(shares[:2], [2])
+
+    with pytest.raises(ValueError):
+        repair_shares(shares[:2], [0])
+
+    with pytest.raises(ValueError):
+        repair_shares(shares[:2], [3, 3])
+
+
+def test_repair_shares_rejects_index_above_total():
+    shares = split(b"secret", 2, 3)
+
+    with pytest.raises(ValueError):
+        repair_shares(shares[:2], [4], total=3)
+
+    assert repair_shares(shares[:2], [3], total=3) == [shares[2]]
+
+
+def test_repair_shares_rejects_fewer_than_threshold():
+    shares = split(b"secret", 3, 5)
+
+    with pytest.raises(ValueError, match="insufficient"):
+        repair_shares(shares[:2], [5], threshold=3)
+
+    assert repair_shares(shares[:3], [5], threshold=3) == [shares[4]]
+
+
+def test_refresh_shares_preserves_secret():
+    secret = os.urandom(200)
+    shares = split(secret, 3, 5)
+
+    refreshed = refresh_shares(shares, 3)
+
+    assert [index for index, _ in refreshed] == [1, 2, 3, 4, 5]
+    assert all(new != old for (_, new), (_, old) in zip(refreshed, shares))
+    assert recover(refreshed[2:]) == secret
+    assert recover([refreshed[0], refreshed[3], refreshed[4]]) == secret
+
+
+def test_refresh_shares_rejects_invalid_input():
+    shares = split(b"secret", 2, 3)
+
+    with pytest.raises(ValueError):
+        refresh_shares(shares, 1)
+
+    with pytest.raises(ValueError):
+        refresh_shares([shares[0], shares[0]], 2)
+
+
+@pytest.mark.parametrize("total", [2, 3, 5, 16])
+def test_full_threshold_split_roundtrip(total):
+    secret = os.urandom(200)
+    shares = split(secret, total, total)
+
+    assert [index for index, _ in shares] == list(range(1, total + 1))
+    assert recover(shares) == secret
+    assert recover(shares[::-1]) == secret
+
+
+def test_full_threshold_split_matches_general_path():
+    from shamir.core.polynomial import interpolate
+
+    shares = split(bytes(range(32)), 4, 4)
+
+    for position in range(32):
+        points = [(index, data[position]) for index, data in shares]
+        assert interpolate(points, x=0) == position
+
+
+def test_full_threshold_split_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        split(b"secret", 3, 3, backend="gpu")
+
+
+def test_select_shares_policies():
+    shares = split(b"secret", 3, 5)
+    shuffled = [shares[3], shares[0], shares[4], shares[1], shares[2]]
+
+    selected, unused = select_shares(shuffled, 3, "first")
+    assert [i for i, _ in selected] == [4, 1, 5]
+    assert [i for i, _ in unused] == [2, 3]
+
+    selected, unused = select_shares(shuffled, 3)
+    assert [i for i, _ in selected] == [1, 2, 3]
+    assert [i for i, _ in unused] == [4, 5]
+
+    selected, unused = select_shares(shuffled, 3, "explicit", [5, 2, 4])
+    assert [i for i, _ in selected] == [5, 2, 4]
+    assert [i for i, _ in unused] == [1, 3]
+
+    for policy in ("first", "lowest"):
+        selected, _ = select_shares(shuffled, 3, policy)
+        assert recover(selected) == b"secret"
+
+
+def test_select_shares_rejects_invalid_selection():
+    shares = split(b"secret", 2, 3)
+
+    with pytest.raises(ValueError):
+        select_shares(shares, 2, "random")
+
+    with pytest.raises(ValueError):
+        select_shares(shares[:1], 2)
+
+    with pytest.raises(ValueError):
+        select_shares(shares, 2, "explicit")
+
+    with pytest.raises(ValueError):
+        select_shares(shares, 2, "explicit", [1, 1])
+
+    with pytest.raises(ValueError):
+        select_shares(shares, 2, "explicit", [1, 9])
+
+    for threshold in (0, 1):
+        with pytest.raises(ValueError, match="at least 2"):
+            select_shares(shares, threshold)
+
+
+def test_recover_with_threshold_selection():
+    from shamir import core
+
+    secret = os.urandom(64)
+    shares = split(secret, 3, 5)
+
+    assert core.recover(shares, threshold=3) == secret
+    assert core.recover(shares[::-1], threshold=3, policy="first") == secret
+    assert core.recover(
+        shares, threshold=3, policy="explicit", indices=[5, 1, 3]
+    ) == secret
+    assert core.recover(shares, threshold=3, check=True) == secret
+
+
+def test_recover_check_rejects_inconsistent_unused_share():
+    from shamir import core
+
+    shares = split(b"threshold trimmed", 3, 5)
+    index, data = shares[4]
+    shares[4] = (index, bytes([data[0] ^ 1]) + data[1:])
+
+    assert core.recover(shares, threshold=3) == b"threshold trimmed"
+
+    with pytest.raises(ValueError, match="inconsistent shares: \\[5\\]"):
+        core.recover(shares, threshold=3, check=True)
+
+    with pytest.raises(ValueError):
+        core.recover(shares, threshold=3, policy="explicit", indices=[1, 2])
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [{"policy": "first"}, {"indices": [1, 2]}, {"check": True}],
+)
+def test_recover_rejects_selection_without_threshold(selection):
+    from shamir import core
+
+    shares = split(b"secret", 2, 3)
+
+    with pytest.raises(ValueError, match="requires a threshold"):
+        core.recover(shares, **selection)
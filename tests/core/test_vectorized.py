@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from shamir.core import kernels, shamir, vectorized
+from shamir.core.gf256 import mul
+
+np = pytest.importorskip("numpy")
+
+
+def test_mul_matches_scalar_arithmetic():
+    a = np.repeat(np.arange(256, dtype=np.uint8), 256)
+    b = np.tile(np.arange(256, dtype=np.uint8), 256)
+    product = vectorized.mul(a, b)
+    expected = [mul(int(x), int(y)) for x, y in zip(a, b)]
+    assert product.tolist() == expected
+
+
+def test_scale_matches_python_kernels():
+    row = np.arange(256, dtype=np.uint8)
+    for c in range(256):
+        assert vectorized.scale(row, c).tobytes() == kernels.scale(
+            row.tobytes(), c
+        )
+
+
+def test_evaluate_rows_matches_python_kernels():
+    rows = [os.urandom(40) for _ in range(4)]
+    xs = [1, 2, 3, 200, 255]
+    assert vectorized.evaluate_rows(rows, xs, 40) == kernels.evaluate_rows(
+        rows, xs, 40
+    )
+
+
+def test_linear_combination_matches_python_kernels():
+    rows = [os.urandom(40) for _ in range(5)]
+    weights = [0, 1, 2, 0x8D, 0xFF]
+    assert vectorized.linear_combination(
+        rows, weights, 40
+    ) == kernels.linear_combination(rows, weights, 40)
+
+
+def test_backends_are_interchangeable():
+    secret = os.urandom(100)
+    parts = shamir.split(secret, threshold=3, total=5, backend="numpy")
+    assert shamir.recover(parts[1:4], backend="python") == secret
+
+    parts = shamir.split(secret, threshold=3, total=5, backend="python")
+    assert shamir.recover(parts[:3], backend="numpy") == secret
+
+
+def test_numpy_backend_unavailable(monkeypatch):
+    monkeypatch.setattr(vectorized, "AVAILABLE", False)
+
+    with pytest.raises(ValueError):
+        shamir.split(b"secret", threshold=2, total=3, backend="numpy")
+
+    parts = shamir.split(b"secret", threshold=2, total=3)
+    assert shamir.recover(parts[:2]) == b"secret"
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        shamir.split(b"secret", threshold=2, total=3, backend="gpu")
@@ -0,0 +1,40 @@
+import pytest
+
+from shamir.format.errors import FormatError
+from shamir.format.packed import parse_packed_share, serialize_packed_share
+from shamir.format.v2 import parse_share
+
+
+def test_packed_share_roundtrip():
+    text = serialize_packed_share(
+        index=3, total=6, privacy=2, count=3, data=b"\x00\x01packed"
+    )
+    share = parse_packed_share(text)
+
+    assert share.index == 3
+    assert share.threshold == 5
+    assert share.total == 6
+    assert share.privacy == 2
+    assert share.count == 3
+    assert share.data == b"\x00\x01packed"
+
+
+def test_format_v2_parser_rejects_packed_share():
+    text = serialize_packed_share(index=1, total=4, privacy=1, count=2, data=b"x")
+
+    with pytest.raises(FormatError):
+        parse_share(text)
+
+
+def test_packed_parser_rejects_inconsistent_threshold():
+    text = serialize_packed_share(index=1, total=4, privacy=1, count=2, data=b"x")
+
+    with pytest.raises(FormatError):
+        parse_packed_share(text.replace("THRESHOLD=3", "THRESHOLD=2"))
+
+
+def test_packed_parser_rejects_format_2_share():
+    text = "FORMAT=2\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\nPRIVACY=1\nCOUNT=1\nDATA=eA==\n"
+
+    with pytest.raises(FormatError):
+        parse_packed_share(text)
@@ -0,0 +1,55 @@
+import pytest
+
+from shamir.format.exceptions import InvalidShareEncoding, InvalidShareMetadata
+from shamir.format.v2 import (
+    binary_to_text,
+    decode_share,
+    encode_share,
+    parse_share,
+    serialize_share,
+    text_to_binary,
+)
+
+
+def test_decode_does_not_copy_payload():
+    record = bytearray(encode_share(1, 2, 3, b"payload bytes"))
+
+    decoded = decode_share(record)
+    assert isinstance(decoded.payload, memoryview)
+    assert decoded.payload.obj is record
+
+    record[8] ^= 0xFF
+    assert decoded.payload[0] == ord("p") ^ 0xFF
+
+
+def test_record_overhead_is_constant():
+    payload = bytes(range(256)) * 16
+
+    assert len(encode_share(1, 2, 3, payload)) == len(payload) + 12
+
+
+def test_reject_trailing_bytes():
+    with pytest.raises(InvalidShareEncoding):
+        decode_share(encode_share(1, 2, 3, b"\x01") + b"\x00")
+
+
+def test_reject_empty_payload():
+    with pytest.raises(InvalidShareEncoding):
+        encode_share(1, 2, 3, b"")
+
+
+def test_reject_index_above_255():
+    with pytest.raises(InvalidShareMetadata):
+        encode_share(256, 2, 3, b"\x01")
+
+
+def test_text_binary_conversion_roundtrip():
+    text = serialize_share(index=2, threshold=2, total=3, data=b"\x00\xffdata")
+
+    record = text_to_binary(text)
+    decoded = decode_share(record)
+
+    assert (decoded.index, decoded.threshold, decoded.total) == (2, 2, 3)
+    assert decoded.payload == b"\x00\xffdata"
+    assert binary_to_text(record) == text
+    assert parse_share(binary_to_text(record)).data == b"\x00\xffdata"
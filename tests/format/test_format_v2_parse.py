@@ -0,0 +1,169 @@
+import os
+
+import pytest
+
+from shamir.format.errors import FormatError
+from shamir.format.v2 import Share, parse_many, parse_share, serialize_share
+
+
+def test_canonical_and_relaxed_layouts_parse_alike():
+    text = serialize_share(index=4, threshold=3, total=9, data=b"\x00\x01\xfe")
+    relaxed = "TOTAL = 9\nINDEX=4\nFORMAT=2\nTHRESHOLD=3\nDATA=AAH+\n"
+
+    expected = Share(index=4, threshold=3, total=9, data=b"\x00\x01\xfe")
+    assert parse_share(text) == expected
+    assert parse_share(relaxed) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "FORMAT=3\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\nDATA=AA==\n",
+        "FORMAT=2\nINDEX=0\nTHRESHOLD=2\nTOTAL=3\nDATA=AA==\n",
+        "FORMAT=2\nINDEX=1\nTHRESHOLD=4\nTOTAL=3\nDATA=AA==\n",
+        "FORMAT=2\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\nDATA=A===\n",
+        "FORMAT=2\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\nDATA=AA==\nEXTRA",
+        "FORMAT=2\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\nDATA=AA==\né",
+    ],
+)
+def test_invalid_shares_rejected(text):
+    with pytest.raises(FormatError):
+        parse_share(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "FORMAT=02\nINDEX=7\nTHRESHOLD=3\nTOTAL=9\nDATA=AAH+\n",
+        "FORMAT=2\nINDEX=07\nTHRESHOLD=3\nTOTAL=9\nDATA=AAH+\n",
+        "FORMAT=2\nINDEX=7\nTHRESHOLD=03\nTOTAL=9\nDATA=AAH+\n",
+        "FORMAT=2\nINDEX=7\nTHRESHOLD=3\nTOTAL=009\nDATA=AAH+\n",
+    ],
+)
+def test_zero_padded_header_fields_parse(tmp_path, text):
+    expected = Share(index=7, threshold=3, total=9, data=b"\x00\x01\xfe")
+
+    path = tmp_path / "share.txt"
+    path.write_text(text, encoding="ascii")
+
+    assert parse_share(text) == expected
+    assert parse_many([path]) == [expected]
+
+
+def test_parse_many_matches_parse_share(tmp_path):
+    texts = [
+        serialize_share(index=1, threshold=2, total=3, data=os.urandom(10)),
+        serialize_share(index=2, threshold=2, total=3, data=os.urandom(100_000)),
+        "INDEX=3\nFORMAT=2\nTHRESHOLD=2\nTOTAL=3\nDATA=AA==\n",
+        serialize_share(index=3, threshold=2, total=3, data=os.urandom(5)),
+    ]
+
+    paths = []
+    for i, text in enumerate(texts):
+        path = tmp_path / f"share-{i}.txt"
+        path.write_text(text, encoding="ascii")
+        paths.append(path)
+
+    assert parse_many(paths) == [parse_share(text) for text in texts]
+
+
+def test_parse_many_rejects_malformed_file(tmp_path):
+    path = tmp_path / "share.txt"
+    path.write_text("FORMAT=2\nINDEX=1\n", encoding="ascii")
+
+    with pytest.raises(FormatError):
+        parse_many([path])
+
+
+def test_share_data_is_decoded_on_first_access():
+    share = parse_share(serialize_share(index=1, threshold=2, total=3, data=b"lazy"))
+
+    assert not share.decoded
+    assert (share.index, share.threshold, share.total) == (1, 2, 3)
+    assert not share.decoded
+
+    assert share.data == b"lazy"
+    assert share.decoded
+
+
+def test_parse_many_decodes_only_used_shares(tmp_path):
+    paths = []
+    for index in range(1, 6):
+        path = tmp_path / f"share-{index}.txt"
+        path.write_text(
+            serialize_share(index=index, threshold=2, total=5, data=bytes([index])),
+            encoding="ascii",
+        )
+        paths.append(path)
+
+    shares = parse_many(paths)
+    chosen = [share.data for share in shares[:2]]
+
+    assert chosen == [b"\x01", b"\x02"]
+    assert [share.decoded for share in shares] == [True, True, False, False, False]
+
+
+def test_share_is_immutable():
+    share = Share(index=1, threshold=2, total=3, data=b"x")
+
+    with pytest.raises(AttributeError):
+        share.index = 2
+
+
+@pytest.mark.parametrize("decode", [False, True])
+def test_share_copies_and_pickles(decode):
+    import copy
+    import dataclasses
+    import pickle
+
+    share = parse_share(serialize_share(index=2, threshold=2, total=3, data=b"xyz"))
+    if decode:
+        share.data
+
+    expected = Share(index=2, threshold=2, total=3, data=b"xyz")
+
+    assert copy.copy(share) == expected
+    assert copy.deepcopy(share) == expected
+    assert pickle.loads(pickle.dumps(share)) == expected
+    assert dataclasses.replace(share, index=3) == Share(3, 2, 3, b"xyz")
+    assert dataclasses.asdict(share) == {
+        "index": 2,
+        "threshold": 2,
+        "total": 3,
+        "data": b"xyz",
+    }
+    assert hash(share) == hash(expected)
+
+
+def test_non_ascii_data_reported_as_encoding_error():
+    from shamir.format.v2 import _parse_fields
+
+    text = "FORMAT=2\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\nDATA=AA\u00e9=\n"
+
+    with pytest.raises(FormatError, match="invalid characters"):
+        _parse_fields(text)
+
+    with pytest.raises(FormatError, match="invalid characters"):
+        parse_share(text)
+
+
+def test_parse_many_does_not_grow_shared_buffer(tmp_path):
+    from shamir.format.v2 import _read_file
+
+    path = tmp_path / "share.txt"
+    text = serialize_share(index=1, threshold=2, total=3, data=os.urandom(1000))
+    path.write_text(text, encoding="ascii")
+
+    buffer = bytearray(64)
+    raw, size = _read_file(path, buffer)
+
+    assert len(buffer) == 64
+    assert raw is not buffer
+    assert bytes(raw[:size]) == text.encode("ascii")
+
+    small = tmp_path / "small.txt"
+    small.write_bytes(b"x" * 10)
+    raw, size = _read_file(small, buffer)
+
+    assert raw is buffer
+    assert bytes(raw[:size]) == b"x" * 10
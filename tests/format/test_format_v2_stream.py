@@ -0,0 +1,96 @@
+import io
+import os
+
+import pytest
+
+from shamir.format.errors import FormatError
+from shamir.format.v2 import (
+    ShareReader,
+    ShareWriter,
+    parse_share,
+    serialize_share,
+)
+
+
+@pytest.mark.parametrize("piece", [1, 2, 3, 7, 64, 1000])
+def test_share_writer_matches_serialize_share(piece):
+    data = os.urandom(500)
+    stream = io.StringIO()
+
+    writer = ShareWriter(stream, index=2, threshold=3, total=5)
+    for offset in range(0, len(data), piece):
+        writer.write(data[offset:offset + piece])
+    writer.close()
+
+    expected = serialize_share(index=2, threshold=3, total=5, data=data)
+    assert stream.getvalue() == expected
+    assert parse_share(stream.getvalue()).data == data
+
+
+def test_share_writer_rejects_write_after_close():
+    writer = ShareWriter(io.StringIO(), index=1, threshold=2, total=3)
+    writer.close()
+
+    with pytest.raises(FormatError):
+        writer.write(b"\x00")
+
+
+def test_share_writer_validates_header():
+    with pytest.raises(FormatError):
+        ShareWriter(io.StringIO(), index=0, threshold=2, total=3)
+
+
+def _read_all(reader, size):
+    out = b""
+    while True:
+        chunk = reader.read(size)
+        if not chunk:
+            return out
+        assert len(chunk) <= size
+        out += chunk
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 7, 64, 10000])
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 100, 1001])
+def test_share_reader_matches_parse_share(size, length):
+    data = os.urandom(length)
+    text = serialize_share(index=4, threshold=3, total=5, data=data)
+
+    reader = ShareReader(io.StringIO(text))
+
+    assert (reader.index, reader.threshold, reader.total) == (4, 3, 5)
+    assert _read_all(reader, size) == parse_share(text).data
+
+
+def test_share_reader_accepts_crlf_line_endings():
+    data = os.urandom(50)
+    text = serialize_share(index=1, threshold=2, total=3, data=data)
+
+    reader = ShareReader(io.StringIO(text.replace("\n", "\r\n")))
+
+    assert _read_all(reader, 5) == data
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "FORMAT=1\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\nDATA=AAAA\n",
+        "FORMAT=2\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\n",
+        "FORMAT=2\nINDEX=0\nTHRESHOLD=2\nTOTAL=3\nDATA=AAAA\n",
+        "FORMAT=2\nINDEX=x\nTHRESHOLD=2\nTOTAL=3\nDATA=AAAA\n",
+    ],
+)
+def test_share_reader_rejects_invalid_header(text):
+    with pytest.raises(FormatError):
+        ShareReader(io.StringIO(text))
+
+
+@pytest.mark.parametrize(
+    "data",
+    ["AA==AAAA", "AAA*", "AAAA\nEXTRA=1", "AAAAA"],
+)
+def test_share_reader_rejects_invalid_data(data):
+    text = f"FORMAT=2\nINDEX=1\nTHRESHOLD=2\nTOTAL=3\nDATA={data}\n"
+
+    with pytest.raises(FormatError):
+        _read_all(ShareReader(io.StringIO(text)), 1)
@@ -68,3 +68,46 @@ def test_encrypt_decrypt_auth_failures():
 
         with pytest.raises(Exception):
             decrypt_secret(bytes(tampered), aad)
+
+
+def _open_payload(secret, payload, aad):
+    from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+
+    from shamir.aead import NONCE_LEN, SALT_LEN, _derive_key
+
+    salt = payload[:SALT_LEN]
+    nonce = payload[SALT_LEN:SALT_LEN + NONCE_LEN]
+    key = _derive_key(secret, salt)
+    return ChaCha20Poly1305(key).decrypt(nonce, payload[SALT_LEN + NONCE_LEN:], aad)
+
+
+def test_encrypt_many_matches_encrypt_secret_format(monkeypatch):
+    import os
+
+    from shamir import aead
+    from shamir.aead import encrypt_many
+
+    calls = []
+    original = os.urandom
+
+    def counting(size):
+        calls.append(size)
+        return original(size)
+
+    monkeypatch.setattr(aead.os, "urandom", counting)
+
+    secrets = [b"key-one", b"key-two", b"key-one"]
+    payloads = encrypt_many(secrets, b"batch")
+
+    assert calls == [(aead.SALT_LEN + aead.NONCE_LEN) * 3]
+    assert len(set(payloads)) == 3
+    for secret, payload in zip(secrets, payloads):
+        assert len(payload) == len(encrypt_secret(secret, b"batch"))
+        assert _open_payload(secret, payload, b"batch") == secret
+
+
+def test_encrypt_many_rejects_empty_secret():
+    from shamir.aead import encrypt_many
+
+    with pytest.raises(ValueError):
+        encrypt_many([b"key", b""])
@@ -0,0 +1,110 @@
+"""
+Automated tests for the short-share hybrid mode.
+
+These tests validate that only the data key is split, that shares
+stay constant-size, and that recovery fails closed when shares and
+ciphertext blobs do not belong together.
+"""
+
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from shamir.hybrid import (
+    DIGEST_LEN,
+    SHARE_LEN,
+    blob_digest,
+    split_short,
+    recover_short,
+    split_dispersed,
+    recover_dispersed,
+)
+
+
+def test_split_recover_roundtrip():
+    secret = os.urandom(10000)
+    result = split_short(secret, 3, 5, b"context")
+
+    assert len(result.shares) == 5
+    assert all(len(data) == SHARE_LEN for _, data in result.shares)
+
+    recovered = recover_short(result.shares[1:4], result.ciphertext, b"context")
+    assert recovered == secret
+
+
+def test_share_size_is_independent_of_secret_size():
+    small = split_short(b"x", 2, 3)
+    large = split_short(os.urandom(100000), 2, 3)
+
+    assert {len(data) for _, data in small.shares} == {SHARE_LEN}
+    assert {len(data) for _, data in large.shares} == {SHARE_LEN}
+
+
+def test_shares_reject_foreign_ciphertext():
+    first = split_short(b"first secret", 2, 3)
+    second = split_short(b"second secret", 2, 3)
+
+    with pytest.raises(ValueError):
+        recover_short(first.shares[:2], second.ciphertext)
+
+
+def test_tampered_ciphertext_fails():
+    result = split_short(b"secret", 2, 3)
+    tampered = bytearray(result.ciphertext)
+    tampered[-1] ^= 0x01
+
+    with pytest.raises(ValueError):
+        recover_short(result.shares[:2], bytes(tampered))
+
+
+def test_tampered_ciphertext_with_matching_digest_fails():
+    result = split_short(b"secret", 2, 3)
+    tampered = bytearray(result.ciphertext)
+    tampered[-1] ^= 0x01
+    tampered = bytes(tampered)
+
+    # Re-point the shares at the tampered blob so only the tag can reject it.
+    digest = blob_digest(tampered)
+    shares = [
+        (index, data[:-DIGEST_LEN] + digest)
+        for index, data in result.shares[:2]
+    ]
+
+    with pytest.raises(InvalidTag):
+        recover_short(shares, tampered)
+
+
+def test_wrong_associated_data_fails():
+    result = split_short(b"secret", 2, 3, b"context")
+
+    with pytest.raises(InvalidTag):
+        recover_short(result.shares[:2], result.ciphertext, b"other")
+
+
+def test_empty_secret_rejected():
+    with pytest.raises(ValueError):
+        split_short(b"", 2, 3)
+
+
+def test_dispersed_roundtrip_and_share_size():
+    secret = os.urandom(9000)
+    shares = split_dispersed(secret, 3, 5, b"context")
+
+    ciphertext_len = len(secret) + 12 + 16
+    for _, data in shares:
+        assert len(data) == SHARE_LEN + -(-(ciphertext_len + 1) // 3)
+
+    assert recover_dispersed(shares[2:], 3, b"context") == secret
+    selected = [shares[4], shares[0], shares[2]]
+    assert recover_dispersed(selected, 3, b"context") == secret
+
+
+def test_dispersed_recovery_detects_corrupt_fragment():
+    shares = split_dispersed(os.urandom(300), 2, 3)
+    index, data = shares[2]
+    corrupted = bytearray(data)
+    corrupted[-1] ^= 0x01
+
+    with pytest.raises(ValueError):
+        recover_dispersed([shares[0], (index, bytes(corrupted))], 2)
@@ -0,0 +1,109 @@
+import os
+
+import pytest
+
+from agents import refresh as refresh_agent
+from shamir.core.shamir import recover, split
+from shamir.format.v2 import parse_share, serialize_share
+from utils.repo import load_share_headers
+
+
+SECRET = b"refresh me" * 30
+
+
+def _write_set(share_dir, threshold, total):
+    share_dir.mkdir()
+    for index, data in split(SECRET, threshold, total):
+        (share_dir / f"share-{index}.txt").write_text(
+            serialize_share(
+                index=index,
+                threshold=threshold,
+                total=total,
+                data=data,
+            ),
+            encoding="utf-8",
+        )
+
+
+def _read_set(share_dir):
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(share_dir.iterdir())
+    }
+
+
+def _recover(share_dir, indices):
+    shares = [
+        parse_share((share_dir / f"share-{i}.txt").read_text(encoding="utf-8"))
+        for i in indices
+    ]
+    return recover([(share.index, share.data) for share in shares])
+
+
+def test_refresh_dir_replaces_every_share(tmp_path):
+    share_dir = tmp_path / "set"
+    _write_set(share_dir, 3, 4)
+    before = _read_set(share_dir)
+
+    assert refresh_agent.refresh_dir(share_dir, 64) == 4
+
+    after = _read_set(share_dir)
+    assert sorted(after) == sorted(before)
+    assert all(after[name] != before[name] for name in before)
+    assert _recover(share_dir, [1, 2, 4]) == SECRET
+    assert _recover(share_dir, [1, 2, 3]) == SECRET
+
+
+def test_interrupted_refresh_keeps_original_shares(tmp_path, monkeypatch):
+    share_dir = tmp_path / "set"
+    _write_set(share_dir, 3, 4)
+    before = _read_set(share_dir)
+
+    real_replace = os.replace
+    swapped = []
+
+    def failing_replace(src, dst):
+        if str(src).endswith(".refresh"):
+            if len(swapped) == 2:
+                raise OSError("interrupted")
+            swapped.append(src)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(refresh_agent.os, "replace", failing_replace)
+
+    with pytest.raises(OSError):
+        refresh_agent.refresh_dir(share_dir, 64)
+
+    assert _read_set(share_dir) == before
+    assert _recover(share_dir, [2, 3, 4]) == SECRET
+
+
+def test_refresh_dir_recovers_from_stale_staged_files(tmp_path):
+    share_dir = tmp_path / "set"
+    _write_set(share_dir, 2, 3)
+    before = _read_set(share_dir)
+
+    # A run killed mid-swap: every original backed up, one share swapped.
+    for index, data in split(b"other polynomial", 2, 3):
+        path = share_dir / f"share-{index}.txt"
+        os.link(path, path.with_name(path.name + ".orig"))
+        path.with_name(path.name + ".refresh").write_text(
+            serialize_share(index=index, threshold=2, total=3, data=data),
+            encoding="utf-8",
+        )
+    os.replace(share_dir / "share-1.txt.refresh", share_dir / "share-1.txt")
+
+    threshold, total, shares = load_share_headers(share_dir)
+    assert (threshold, total) == (2, 3)
+    assert sorted(path.name for path in shares.values()) == [
+        "share-1.txt",
+        "share-2.txt",
+        "share-3.txt",
+    ]
+
+    refresh_agent.restore_interrupted(share_dir)
+    assert _read_set(share_dir) == before
+
+    assert refresh_agent.refresh_dir(share_dir, 64) == 3
+    assert sorted(_read_set(share_dir)) == sorted(before)
+    assert _recover(share_dir, [1, 3]) == SECRET
@@ -0,0 +1,67 @@
+import sys
+
+import pytest
+
+from agents import repair as repair_agent
+from shamir.core.shamir import split
+from shamir.format.v2 import serialize_share
+
+
+SECRET = b"repair me" * 500
+
+
+def _write_set(share_dir, threshold, total):
+    share_dir.mkdir()
+    for index, data in split(SECRET, threshold, total):
+        (share_dir / f"share-{index}.txt").write_text(
+            serialize_share(
+                index=index,
+                threshold=threshold,
+                total=total,
+                data=data,
+            ),
+            encoding="utf-8",
+        )
+
+
+def _run(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["repair.py", *args])
+    repair_agent.main()
+
+
+def test_repair_regenerates_removed_share_file(tmp_path, monkeypatch):
+    share_dir = tmp_path / "set"
+    output_dir = tmp_path / "out"
+    _write_set(share_dir, 3, 5)
+
+    removed = (share_dir / "share-4.txt").read_bytes()
+    (share_dir / "share-4.txt").unlink()
+
+    _run(
+        monkeypatch,
+        "--input-dir", str(share_dir),
+        "--output-dir", str(output_dir),
+        "--index", "4",
+        "--chunk-size", "1000",
+    )
+
+    assert (output_dir / "share-4.txt").read_bytes() == removed
+
+
+def test_repair_rejects_fewer_than_threshold_shares(tmp_path, monkeypatch):
+    share_dir = tmp_path / "set"
+    output_dir = tmp_path / "out"
+    _write_set(share_dir, 3, 5)
+
+    for index in (3, 4, 5):
+        (share_dir / f"share-{index}.txt").unlink()
+
+    with pytest.raises(ValueError, match="insufficient"):
+        _run(
+            monkeypatch,
+            "--input-dir", str(share_dir),
+            "--output-dir", str(output_dir),
+            "--index", "3",
+        )
+
+    assert not (output_dir / "share-3.txt").exists()
@@ -10,7 +10,17 @@ import json
 import pathlib
 import pytest
 
-from shamir.sss_gf256 import split, recover
+from shamir.gf256 import gf_mul
+from shamir.sss_gf256 import (
+    split,
+    split_stream,
+    recover,
+    recover_stream,
+    refresh_stream,
+    repair_stream,
+    subshare_stream,
+    _lagrange_weights,
+)
 
 
 VECTORS_DIR = pathlib.Path(__file__).parent / "vectors" / "sss"
@@ -59,6 +69,277 @@ def test_split_recover_failures():
             recover(selected)
 
 
+def test_recover_is_share_order_independent():
+    secret = b"order independent"
+    shares = split(secret, 3, 5)
+
+    assert recover(shares[:3]) == recover(list(reversed(shares[:3])))
+
+
+def test_lagrange_weights_cached_per_index_set():
+    _lagrange_weights.cache_clear()
+
+    secret = b"cached weights"
+    shares = split(secret, 3, 5)
+
+    recover([shares[0], shares[2], shares[4]])
+    recover([shares[4], shares[0], shares[2]])
+
+    info = _lagrange_weights.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_lagrange_weights_match_bytewise_interpolation():
+    from shamir.core.polynomial import interpolate
+
+    xs = (2, 5, 9)
+    weights = _lagrange_weights(xs)
+
+    for ys in [(1, 2, 3), (0xFF, 0x00, 0x80), (7, 7, 7)]:
+        expected = interpolate(list(zip(xs, ys)), x=0)
+        acc = 0
+        for w, y in zip(weights, ys):
+            acc ^= gf_mul(w, y)
+        assert acc == expected
+
+
+def test_split_stream_roundtrip():
+    import io
+    import os
+
+    secret = os.urandom(1000)
+    writers = [io.BytesIO() for _ in range(5)]
+
+    consumed = split_stream(io.BytesIO(secret), writers, 3, 5, chunk_size=64)
+
+    assert consumed == len(secret)
+    shares = [(i + 1, w.getvalue()) for i, w in enumerate(writers)]
+    assert recover(shares[:3]) == secret
+    assert recover(shares[2:]) == secret
+
+
+def test_split_stream_shares_do_not_expose_secret():
+    import io
+
+    secret = b"stream secret" * 8
+    writers = [io.BytesIO() for _ in range(3)]
+
+    split_stream(io.BytesIO(secret), writers, 2, 3, chunk_size=32)
+
+    first, second = writers[0].getvalue(), writers[1].getvalue()
+    assert first != secret
+    assert second != secret
+    assert first != second
+
+
+def test_split_stream_rejects_writer_count_mismatch():
+    import io
+
+    with pytest.raises(ValueError):
+        split_stream(io.BytesIO(b"secret"), [io.BytesIO()], 2, 3)
+
+
+def test_recover_stream_matches_recover():
+    import io
+    import os
+
+    secret = os.urandom(1000)
+    shares = split(secret, 3, 5)
+    selected = [shares[0], shares[3], shares[4]]
+
+    output = io.BytesIO()
+    written = recover_stream(
+        [(x, io.BytesIO(data)) for x, data in selected],
+        output,
+        chunk_size=64,
+    )
+
+    assert written == len(secret)
+    assert output.getvalue() == recover(selected) == secret
+
+
+def test_recover_stream_rejects_inconsistent_lengths():
+    import io
+
+    with pytest.raises(ValueError):
+        recover_stream(
+            [(1, io.BytesIO(b"ab")), (2, io.BytesIO(b"a"))],
+            io.BytesIO(),
+        )
+
+
+def test_repair_stream_regenerates_missing_shares():
+    import io
+
+    from shamir.core.shamir import split as random_split
+
+    shares = random_split(bytes(range(200)), 3, 5)
+    selected = [shares[0], shares[2], shares[4]]
+    writers = [(2, io.BytesIO()), (4, io.BytesIO())]
+
+    written = repair_stream(
+        [(x, io.BytesIO(data)) for x, data in selected],
+        writers,
+        chunk_size=64,
+    )
+
+    assert written == 200
+    assert [(x, w.getvalue()) for x, w in writers] == [shares[1], shares[3]]
+
+
+def test_repair_stream_rejects_index_above_total():
+    import io
+
+    from shamir.core.shamir import split as random_split
+
+    shares = random_split(bytes(range(50)), 2, 3)
+    writer = io.BytesIO()
+
+    with pytest.raises(ValueError):
+        repair_stream(
+            [(x, io.BytesIO(data)) for x, data in shares[:2]],
+            [(4, writer)],
+            total=3,
+        )
+
+    assert writer.getvalue() == b""
+
+
+def test_repair_stream_rejects_fewer_than_threshold():
+    import io
+
+    from shamir.core.shamir import split as random_split
+
+    shares = random_split(bytes(range(50)), 3, 5)
+    writer = io.BytesIO()
+
+    with pytest.raises(ValueError, match="Insufficient"):
+        repair_stream(
+            [(x, io.BytesIO(data)) for x, data in shares[:2]],
+            [(5, writer)],
+            threshold=3,
+        )
+
+    assert writer.getvalue() == b""
+
+
+def test_refresh_stream_preserves_secret():
+    import io
+    import os
+
+    from shamir.core.shamir import split as random_split
+
+    secret = os.urandom(500)
+    shares = random_split(secret, 3, 4)
+    writers = [io.BytesIO() for _ in shares]
+
+    written = refresh_stream(
+        [(x, io.BytesIO(data)) for x, data in shares],
+        writers,
+        3,
+        chunk_size=64,
+    )
+
+    refreshed = [(x, w.getvalue()) for (x, _), w in zip(shares, writers)]
+    assert written == 500
+    assert refreshed != shares
+    assert recover(refreshed[1:]) == secret
+
+
+def test_subshare_stream_reshares_through_recover_stream():
+    import io
+    import os
+
+    from shamir.core.shamir import recover as random_recover
+    from shamir.core.shamir import split as random_split
+
+    secret = os.urandom(300)
+    old = random_split(secret, 2, 3)[1:]
+
+    sent = {}
+    for index, data in old:
+        writers = [io.BytesIO() for _ in range(4)]
+        subshare_stream(io.BytesIO(data), writers, 3, 4, chunk_size=64)
+        sent[index] = [w.getvalue() for w in writers]
+
+    new_shares = []
+    for j in range(1, 5):
+        output = io.BytesIO()
+        recover_stream(
+            [(index, io.BytesIO(sent[index][j - 1])) for index, _ in old],
+            output,
+            chunk_size=64,
+        )
+        new_shares.append((j, output.getvalue()))
+
+    assert random_recover(new_shares[:3]) == secret
+
+
+def test_streams_with_workers_roundtrip():
+    import io
+    import os
+
+    secret = os.urandom(3000)
+    writers = [io.BytesIO() for _ in range(3)]
+
+    split_stream(io.BytesIO(secret), writers, 2, 3, chunk_size=1000, workers=2)
+
+    shares = [(i + 1, w.getvalue()) for i, w in enumerate(writers)]
+    assert recover(shares[:2]) == secret
+
+    output = io.BytesIO()
+    recover_stream(
+        [(x, io.BytesIO(data)) for x, data in shares[1:]],
+        output,
+        chunk_size=1000,
+        workers=2,
+    )
+    assert output.getvalue() == secret
+
+
+def test_recover_with_threshold_selection():
+    from shamir.core.shamir import split as random_split
+
+    secret = b"threshold trimmed"
+    shares = random_split(secret, 3, 5)
+
+    assert recover(shares, threshold=3) == secret
+    assert recover(shares[::-1], threshold=3, policy="first") == secret
+    assert recover(
+        shares, threshold=3, policy="explicit", indices=[2, 4, 5]
+    ) == secret
+    assert recover(shares, threshold=3, check=True) == secret
+
+
+def test_recover_check_rejects_inconsistent_unused_share():
+    import pytest
+
+    from shamir.core.shamir import split as random_split
+
+    shares = random_split(b"threshold trimmed", 3, 5)
+    index, data = shares[4]
+    shares[4] = (index, bytes([data[0] ^ 1]) + data[1:])
+
+    assert recover(shares, threshold=3) == b"threshold trimmed"
+
+    with pytest.raises(ValueError, match="inconsistent shares"):
+        recover(shares, threshold=3, check=True)
+
+
+def test_recover_rejects_selection_without_threshold():
+    from shamir.core.shamir import split as random_split
+
+    shares = random_split(b"secret", 2, 3)
+
+    for selection in ({"policy": "lowest"}, {"indices": [1, 3]}, {"check": True}):
+        with pytest.raises(ValueError, match="requires a threshold"):
+            recover(shares, **selection)
+
+    with pytest.raises(ValueError, match="at least 2"):
+        recover(shares, threshold=1)
+
+
 def _b64d(text: str) -> bytes:
     import base64
     return base64.b64decode(text.encode("ascii"))
@@ -13,7 +13,9 @@ import json
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+from shamir.format.v2 import ShareReader
 
 
 BASE_DIR = Path("artifacts")
@@ -21,6 +23,10 @@ SHARES_DIR = BASE_DIR / "shares"
 LOG_DIR = BASE_DIR / "logs"
 MANIFEST_DIR = BASE_DIR / "manifests"
 
+# Files left next to share files by an in-progress share refresh
+STAGED_SUFFIX = ".refresh"
+BACKUP_SUFFIX = ".orig"
+
 
 def _ensure_dirs():
     for d in (SHARES_DIR, LOG_DIR, MANIFEST_DIR):
@@ -68,6 +74,43 @@ def load_manifest(label: str) -> dict:
     return json.loads(path.read_text())
 
 
+def load_share_headers(share_dir: Path) -> Tuple[int, int, Dict[int, Path]]:
+    """
+    Read FORMAT=2 share headers in a directory.
+
+    Returns (threshold, total, {index: path}). Share data is not read.
+    Staged and backup files of a share refresh are skipped.
+    """
+    shares = {}
+    threshold = None
+    total = None
+
+    for path in sorted(share_dir.iterdir()):
+        if not path.is_file():
+            continue
+        if path.suffix in (STAGED_SUFFIX, BACKUP_SUFFIX):
+            continue
+
+        with path.open("r", encoding="utf-8") as handle:
+            share = ShareReader(handle)
+
+        if threshold is None:
+            threshold = share.threshold
+            total = share.total
+        elif share.threshold != threshold or share.total != total:
+            raise ValueError("inconsistent share parameters")
+
+        if share.index in shares:
+            raise ValueError("duplicate share index")
+
+        shares[share.index] = path
+
+    if threshold is None:
+        raise ValueError("no valid share files found")
+
+    return threshold, total, shares
+
+
 def _log_event(event_type: str, payload: dict):
     """
     Append an explicit operational log entry.